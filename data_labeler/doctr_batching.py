@@ -0,0 +1,78 @@
+from logging import getLogger
+
+import cv2
+import numpy as np
+from pd_book_tools.ocr.page import Page
+
+# doctr (and with it torch) is imported when a batch is run, so the NiceGUI
+# labeler can import this module without loading it
+logger = getLogger(__name__)
+
+
+class _UnexpectedPredictorInput(RuntimeError):
+    pass
+
+
+class _PrecomputedPredictor:
+    """Hands an already computed doctr result to doctr_ocr_cv2_image.
+
+    Only valid if doctr_ocr_cv2_image calls the predictor once, with the
+    same RGB page the batch was run on; anything else raises
+    _UnexpectedPredictorInput so the page can be OCR'd on its own instead.
+    """
+
+    def __init__(self, predictor, result, expected_page: np.ndarray):
+        self._predictor = predictor
+        self._result = result
+        self._expected_page = expected_page
+        self._called = False
+
+    def __call__(self, pages, *args, **kwargs):
+        if self._called:
+            raise _UnexpectedPredictorInput("predictor called more than once")
+        self._called = True
+        if len(pages) != 1 or not np.array_equal(pages[0], self._expected_page):
+            raise _UnexpectedPredictorInput("predictor input differs from the batch")
+        return self._result
+
+    def __getattr__(self, name):
+        return getattr(self._predictor, name)
+
+
+def batch_doctr_ocr_cv2_images(
+    predictor, cv2_numpy_images, source_images
+) -> list[Page]:
+    """OCR BGR page images with a single predictor call.
+
+    Each page is still converted by doctr_ocr_cv2_image, so it comes out
+    the same as a page OCR'd on its own.
+    """
+    from doctr.io import Document as DoctrDocument
+    from pd_book_tools.ocr.cv2_doctr import doctr_ocr_cv2_image
+
+    rgb_images = [cv2.cvtColor(image, cv2.COLOR_BGR2RGB) for image in cv2_numpy_images]
+    doctr_result = predictor(rgb_images)
+
+    ocr_pages = []
+    for cv2_numpy_image, rgb_image, source_image, doctr_page in zip(
+        cv2_numpy_images, rgb_images, source_images, doctr_result.pages
+    ):
+        try:
+            ocr_page = doctr_ocr_cv2_image(
+                image=cv2_numpy_image,
+                source_image=str(source_image),
+                predictor=_PrecomputedPredictor(
+                    predictor, DoctrDocument(pages=[doctr_page]), rgb_image
+                ),
+            )
+        except _UnexpectedPredictorInput as e:
+            logger.warning(
+                "Batched OCR result unusable (%s); OCRing %s alone", e, source_image
+            )
+            ocr_page = doctr_ocr_cv2_image(
+                image=cv2_numpy_image,
+                source_image=str(source_image),
+                predictor=predictor,
+            )
+        ocr_pages.append(ocr_page)
+    return ocr_pages
@@ -0,0 +1,67 @@
+import os
+import pathlib
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+from numpy import ascontiguousarray, ndarray
+
+try:
+    # Faster JPEG encoding and decoding when available (the fast-jpeg extra)
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# Every image the labelers show is a preview (exports copy the source PNG),
+# so they are all sent as JPEG at this quality
+PREVIEW_JPEG_QUALITY = 85
+
+# Shared by the labelers and line editors; the encoders release the GIL,
+# so images submitted together encode in parallel
+ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def encode_bgr_image_as_jpeg(
+    image: ndarray, quality: int = PREVIEW_JPEG_QUALITY
+) -> bytes:
+    """Encode a BGR image as JPEG bytes."""
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(
+            ascontiguousarray(image), quality=quality, colorspace="BGR"
+        )
+    ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Failed to encode image as JPEG.")
+    return buffer.tobytes()
+
+
+def encode_bgr_image_as_fast_png(image: ndarray) -> bytes:
+    """Encode a BGR image as PNG with the fastest compression settings."""
+    ok, buffer = cv2.imencode(
+        ".png",
+        image,
+        [
+            cv2.IMWRITE_PNG_COMPRESSION,
+            1,
+            cv2.IMWRITE_PNG_STRATEGY,
+            cv2.IMWRITE_PNG_STRATEGY_RLE,
+        ],
+    )
+    if not ok:
+        raise ValueError("Failed to encode image as PNG.")
+    return buffer.tobytes()
+
+
+def get_encoded_preview_image(img: ndarray, quality: int = PREVIEW_JPEG_QUALITY) -> str:
+    """Encode a BGR preview image as a JPEG data URI."""
+    jpeg = encode_bgr_image_as_jpeg(img, quality)
+    return "data:image/jpeg;base64," + b64encode(jpeg).decode("ascii")
+
+
+def decode_image(path: pathlib.Path):
+    """Read an image file as a BGR array (None if it can't be read)."""
+    path_str = str(path.resolve())
+    if simplejpeg is not None and path.suffix.lower() in (".jpg", ".jpeg"):
+        with open(path_str, "rb") as f:
+            return simplejpeg.decode_jpeg(f.read(), colorspace="BGR")
+    return cv2.imread(path_str)
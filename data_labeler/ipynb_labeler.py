@@ -1,16 +1,28 @@
+import asyncio
+import copy
+import os
 import pathlib
-
-# from logging import DEBUG as logging_DEBUG
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack
+from functools import lru_cache, partial
+from html import escape
+
+from logging import DEBUG as logging_DEBUG
 from logging import getLogger
-from textwrap import dedent
 from typing import Optional
+from urllib.parse import quote
 
 import cv2
+import numpy as np
+import torch
 from IPython.display import display
 from ipywidgets import (
     HTML,
     BoundedIntText,
     Button,
+    GridBox,
     HBox,
     Image,
     Layout,
@@ -22,15 +34,14 @@ from shutil import copyfile
 
 from doctr.models.predictor.pytorch import OCRPredictor
 
-from pd_book_tools.image_processing.cv2_processing.encoding import (
-    encode_bgr_image_as_png,
-)
 from pd_book_tools.ocr.document import Document
 from pd_book_tools.ocr.page import Page
 from pd_book_tools.pgdp.pgdp_results import PGDPExport, PGDPPage
 from pd_book_tools.ocr.cv2_doctr import doctr_ocr_cv2_image, get_default_doctr_predictor
 
 
+from .doctr_batching import batch_doctr_ocr_cv2_images
+from .image_encoding import ENCODE_POOL, decode_image, encode_bgr_image_as_jpeg
 from .ipynb_page_editor import IpynbPageEditor
 
 # Configure logging
@@ -40,11 +51,133 @@ ui_logger = getLogger(__name__ + ".UI")
 
 layout_no_padding_margin = Layout(padding="0px", margin="0px", flex="1 1 auto")
 
+# Page images are shown at most this tall (see the image widget layouts)
+DISPLAY_IMAGE_MAX_HEIGHT = 900
+
+# Shared by all the page image widgets rather than one Layout widget each
+layout_page_image = Layout(
+    min_width="300px",
+    max_height=f"{DISPLAY_IMAGE_MAX_HEIGHT}px",
+    align_self="baseline",
+)
+layout_overflow_visible = Layout(overflow="visible")
+# The plain page image is also the base of the SVG overlay tabs, where it
+# shares the single grid cell with its overlay
+layout_page_image_base = Layout(
+    min_width="300px",
+    max_height=f"{DISPLAY_IMAGE_MAX_HEIGHT}px",
+    align_self="baseline",
+    grid_row="1",
+    grid_column="1",
+)
+layout_page_overlay = Layout(grid_row="1", grid_column="1")
+layout_page_overlay_grid = Layout(
+    grid_template_columns="auto",
+    justify_content="flex-start",
+    overflow="visible",
+)
+
+# Outline colors of the SVG overlays; match colors follow the line editor
+OVERLAY_WORD_COLOR = "red"
+OVERLAY_LINE_COLOR = "blue"
+OVERLAY_EXACT_MATCH_COLOR = "green"
+OVERLAY_PARTIAL_MATCH_COLOR = "blue"
+OVERLAY_NO_MATCH_COLOR = "red"
+
+
+def _encode_for_display(image, max_h: int = DISPLAY_IMAGE_MAX_HEIGHT) -> bytes:
+    """Downscale a BGR image to the display height and encode it as JPEG."""
+    scale = min(1.0, max_h / image.shape[0])
+    if scale < 1.0:
+        image = cv2.resize(
+            image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
+    return encode_bgr_image_as_jpeg(image)
+
+
+def _svg_overlay(boxes) -> str:
+    """Outline (color, (left, top, right, bottom)) boxes in normalized page coordinates."""
+    rects = "".join(
+        f'<rect x="{left:.5f}" y="{top:.5f}" width="{right - left:.5f}" '
+        f'height="{bottom - top:.5f}" stroke="{color}"/>'
+        for color, (left, top, right, bottom) in boxes
+    )
+    return (
+        '<svg viewBox="0 0 1 1" preserveAspectRatio="none" fill="none">'
+        f"{rects}</svg>"
+    )
+
+
+def _word_match_color(word) -> str:
+    match_score = word.ground_truth_match_keys.get("match_score")
+    if match_score is None or (match_score == 0 and not word.ground_truth_text):
+        return OVERLAY_NO_MATCH_COLOR
+    if match_score != 100:
+        return OVERLAY_PARTIAL_MATCH_COLOR
+    return OVERLAY_EXACT_MATCH_COLOR
+
+
+def _css_string(value: str) -> str:
+    """Escape a value for use inside a single-quoted CSS string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+@lru_cache(maxsize=8)
+def _build_jupyter_css(monospace_font_name: str, monospace_font_path: str | None) -> str:
+    # Inject custom CSS for the Jupyter environment
+    font_name = _css_string(monospace_font_name)
+    font_face = ""
+    if monospace_font_path is not None:
+        # Without a font file the name is expected to be an installed font
+        font_url = _css_string(quote(monospace_font_path))
+        font_face = f"""
+    @font-face {{
+        font-family: '{font_name}';
+        src: url('{font_url}') format('truetype');
+    }}
+    """
+    css = f"""{font_face}
+    input, textarea {{
+        font-family: '{font_name}', monospace !important;
+        font-size: 12px !important;
+    }}
+
+    .mono td {{
+        font-family: '{font_name}', monospace;
+        font-size: 12px;
+    }}
+
+    .page-overlay {{
+        position: relative;
+        pointer-events: none;
+    }}
+
+    .page-overlay svg {{
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+    }}
+
+    .page-overlay rect {{
+        vector-effect: non-scaling-stroke;
+        stroke-width: 1px;
+    }}
+    """
+    logger.debug("Custom CSS:\n" + css)
+    return css
+
 
 class IpynbLabeler:
     _current_page_idx: int = 0
     _total_pages: int = 0
 
+    # Parts of the UI refresh_ui can update independently
+    REFRESH_PARTS = ("header", "images", "text", "matches")
+    _dirty: set[str]
+    _refreshing: bool = False
+
     current_page_name = ""
     go_to_page_idx = 0
 
@@ -55,6 +188,7 @@ class IpynbLabeler:
     next_button: Button
     current_page_idx_display: HTML
     current_page_name_display: HTML
+    ocr_status_display: HTML
     go_to_page_button: Button
     go_to_page_textbox: BoundedIntText
     header_box: HBox
@@ -69,26 +203,36 @@ class IpynbLabeler:
     image_tab: Tab
     plain_image_vbox: VBox
     ocr_image_pgh_bounding_box_vbox: VBox
-    ocr_image_lines_bounding_box_vbox: VBox
-    ocr_image_words_bounding_box_vbox: VBox
-    ocr_image_mismatches_vbox: VBox
+    ocr_image_lines_bounding_box_vbox: GridBox
+    ocr_image_words_bounding_box_vbox: GridBox
+    ocr_image_mismatches_vbox: GridBox
 
     plain_image: Image
     ocr_image_pgh_bounding_box: Image
-    ocr_image_lines_bounding_box: Image
-    ocr_image_words_bounding_box: Image
-    ocr_image_mismatches: Image
+    # SVG box overlays drawn over plain page images
+    ocr_lines_overlay: HTML
+    ocr_words_overlay: HTML
+    ocr_mismatches_overlay: HTML
 
     # Right - Editor Tabs
     editor_tab: Tab
     editor_ocr_text_vbox: VBox
     editor_p3_text_vbox: VBox
+    editor_ocr_text_html: HTML
+    editor_p3_text_html: HTML
 
-    matched_ocr_pages = {}
+    # Row of the OCR/P3 text tables; styled by the ".mono td" rule in _jupyter_css
+    _text_row_template = "<tr><td>%s</td><td>%s</td></tr>"
 
-    monospace_font_name: str
-    monospace_font_path: pathlib.Path
+    # OCR pages by page index, least recently used first
+    matched_ocr_pages: OrderedDict[int, dict]
+    max_cached_pages: int = 8
+    _matched_ocr_pages_lock: threading.Lock
+    # Pages edited since they were last saved; these are never evicted
+    _unsaved_pages: set[int]
 
+    monospace_font_name: str
+    monospace_font_path: pathlib.Path | None = None
     doctr_predictor: Optional[OCRPredictor] = None
     pgdp_export: PGDPExport
     labeled_ocr_path: pathlib.Path
@@ -96,57 +240,60 @@ class IpynbLabeler:
     validation_set_output_path: pathlib.Path
 
     page_indexby_name: dict
-    page_indexby_nbr: dict
+
+    # Saved OCR JSON per page; pages known to have no saved JSON
+    _ocr_json_paths: dict[int, pathlib.Path]
+    _missing_ocr_json: set[int]
+    _page_stems: list[str]
 
     ocr_models: dict
     main_ocr_predictor: OCRPredictor
+    ocr_device: str = "cpu"
+    ocr_autocast_dtype: torch.dtype = torch.float16
 
     page_editor: IpynbPageEditor
 
+    # One <style> widget for every labeler in the notebook
+    _css_widget: HTML | None = None
+
+    # Encoded display images per page index: image name -> (array key, bytes)
+    _display_image_cache: dict[int, dict[str, tuple[tuple, bytes]]]
+    # Pages edited since their paragraph raster was last drawn
+    _stale_paragraph_images: set[int]
+
+    # Background OCR of the next page; per-page locks let run_ocr wait on it
+    _ocr_pool: ThreadPoolExecutor
+    _prefetch_futures: dict[int, Future]
+    # Pages ahead of the current one to OCR as a single predictor batch
+    prefetch_page_count: int = 3
+    _page_locks: dict[int, threading.Lock]
+    _predictor_lock: threading.Lock
+    # Cold-page OCR started by refresh_ui, finished on the kernel's event loop
+    _refresh_future: Future | None = None
+    # Exports write to disk in the background; a page's next save or import
+    # waits for its previous one
+    _io_pool: ThreadPoolExecutor
+    _pending_saves: dict[int, list[Future]]
+
     def init_font(
         self,
         monospace_font_name: str,
         monospace_font_path: pathlib.Path | str | None = None,
     ):
-        self.monospace_font_name = monospace_font_name
+        self.monospace_font_name = monospace_font_name or "monospace"
         if isinstance(monospace_font_path, str):
             monospace_font_path = pathlib.Path(monospace_font_path)
-        if monospace_font_path is not None and pathlib.Path.exists(monospace_font_path):
-            self.monospace_font_path = monospace_font_path
-            # Inject custom CSS for font definition in the Jupyter environment
-            css = dedent(
-                f"""
-                @font-face {{
-                    font-family: '{self.monospace_font_name}';
-                    src: url('{self.monospace_font_path}') format('truetype');
-                }}
-                """
-            )
-        elif monospace_font_name:
-            # If no path is provided, use the font name to define the font
-            css = dedent(
-                f"""
-                @font-face {{
-                    font-family: '{self.monospace_font_name}';
-                }}
-                """
-            )
-        else:
-            # Fallback to a default monospace font if no path is provided
-            css = dedent(
-                """
-                @font-face {{
-                    font-family: 'monospace';
-                }}
-                """
-            )
-        display(HTML(f"<style>{css}</style>"))
+        if monospace_font_path is not None and not monospace_font_path.exists():
+            logger.warning(f"Monospace font file not found: {monospace_font_path}")
+            monospace_font_path = None
+        self.monospace_font_path = monospace_font_path
 
     def init_header_ui(self):
         self.prev_button = Button(description="Previous")
         self.next_button = Button(description="Next")
         self.current_page_idx_display = HTML("")
         self.current_page_name_display = HTML("")
+        self.ocr_status_display = HTML("")
         self.go_to_page_button = Button(description="Go to Page #")
         self.go_to_page_textbox = BoundedIntText()
         self.go_to_page_textbox.layout = Layout(width="65px")
@@ -172,6 +319,7 @@ class IpynbLabeler:
 
         def reload_ocr_from_file(event):
             self.import_ocr_document()
+            self.mark_dirty("images", "text", "matches")
             self.refresh_ui()
 
         self.reload_ocr_from_file_button.on_click(
@@ -244,6 +392,7 @@ class IpynbLabeler:
                         self.prev_button,
                         self.current_page_idx_display,
                         self.current_page_name_display,
+                        self.ocr_status_display,
                         self.next_button,
                         self.go_to_page_button,
                         self.go_to_page_textbox,
@@ -280,66 +429,75 @@ class IpynbLabeler:
         self.go_to_page_button.on_click(self.go_to_page)
 
     def init_image_ui(self):
-        self.plain_image = Image(
-            layout=Layout(min_width="300px", max_height="900px", align_self="baseline")
-        )
+        # One page image, sent once and shown in every tab but Paragraphs;
+        # the word, line and mismatch boxes are SVG drawn over it
+        self.plain_image = Image(format="jpeg", layout=layout_page_image_base)
         self.plain_image_vbox = VBox([self.plain_image])
 
-        self.ocr_image_pgh_bounding_box = Image(
-            layout=Layout(min_width="300px", max_height="900px", align_self="baseline")
-        )
+        self.ocr_image_pgh_bounding_box = Image(format="jpeg", layout=layout_page_image)
         self.ocr_image_pgh_bounding_box_vbox = VBox(
-            [self.ocr_image_pgh_bounding_box], layout={"overflow": "visible"}
+            [self.ocr_image_pgh_bounding_box], layout=layout_overflow_visible
         )
 
-        self.ocr_image_lines_bounding_box = Image(
-            layout=Layout(min_width="300px", max_height="900px", align_self="baseline")
-        )
-        self.ocr_image_lines_bounding_box_vbox = VBox(
-            [self.ocr_image_lines_bounding_box], layout={"overflow": "visible"}
+        self.ocr_lines_overlay = HTML(layout=layout_page_overlay)
+        self.ocr_lines_overlay.add_class("page-overlay")
+        self.ocr_image_lines_bounding_box_vbox = GridBox(
+            [self.plain_image, self.ocr_lines_overlay], layout=layout_page_overlay_grid
         )
 
-        self.ocr_image_words_bounding_box = Image(
-            layout=Layout(min_width="300px", max_height="900px", align_self="baseline")
+        self.ocr_words_overlay = HTML(layout=layout_page_overlay)
+        self.ocr_words_overlay.add_class("page-overlay")
+        self.ocr_image_words_bounding_box_vbox = GridBox(
+            [self.plain_image, self.ocr_words_overlay], layout=layout_page_overlay_grid
         )
-        self.ocr_image_words_bounding_box_vbox = VBox(
-            [self.ocr_image_words_bounding_box], layout={"overflow": "visible"}
+
+        self.ocr_mismatches_overlay = HTML(layout=layout_page_overlay)
+        self.ocr_mismatches_overlay.add_class("page-overlay")
+        self.ocr_image_mismatches_vbox = GridBox(
+            [self.plain_image, self.ocr_mismatches_overlay],
+            layout=layout_page_overlay_grid,
         )
 
-        self.ocr_image_mismatches = Image(
-            layout=Layout(min_width="300px", max_height="900px", align_self="baseline")
+        image_tab_titles = (
+            "Mismatches",
+            "Original",
+            "Paragraphs",
+            "Lines",
+            "Words",
         )
-        self.ocr_image_mismatches_vbox = VBox(
-            [self.ocr_image_mismatches], layout={"overflow": "visible"}
+        image_tab_boxes = (
+            self.ocr_image_mismatches_vbox,
+            self.plain_image_vbox,
+            self.ocr_image_pgh_bounding_box_vbox,
+            self.ocr_image_lines_bounding_box_vbox,
+            self.ocr_image_words_bounding_box_vbox,
         )
 
-        image_tabs = [
-            (
-                "Mismatches",
-                self.ocr_image_mismatches_vbox,
-            ),
-            (
-                "Original",
-                self.plain_image_vbox,
-            ),
-            (
-                "Paragraphs",
-                self.ocr_image_pgh_bounding_box_vbox,
-            ),
-            (
-                "Lines",
-                self.ocr_image_lines_bounding_box_vbox,
-            ),
-            (
-                "Words",
-                self.ocr_image_words_bounding_box_vbox,
-            ),
-        ]
-        image_tab_titles, image_tab_boxes = zip(*image_tabs)
-
         self.image_tab = Tab(children=image_tab_boxes)
         self.image_tab.titles = image_tab_titles
 
+        # Only the visible tab's images and overlays are filled in; the rest
+        # are filled in when their tab is selected
+        self._image_widgets = {
+            "page_image": self.plain_image,
+            "ocr_image_pgh_bounding_box": self.ocr_image_pgh_bounding_box,
+        }
+        self._overlay_widgets = {
+            "mismatches": self.ocr_mismatches_overlay,
+            "lines": self.ocr_lines_overlay,
+            "words": self.ocr_words_overlay,
+        }
+        # What each tab shows, in tab order
+        self._tab_keys = (
+            ("page_image", "mismatches"),
+            ("page_image",),
+            ("ocr_image_pgh_bounding_box",),
+            ("page_image", "lines"),
+            ("page_image", "words"),
+        )
+        self._shown_images = set()
+        self.image_tab.observe(self._on_image_tab_change, names="selected_index")
+
         self.image_vbox = VBox(
             [
                 self.image_tab,
@@ -360,35 +518,37 @@ class IpynbLabeler:
             current_ocr_page = None
 
         def page_image_change_callback():
-            self.current_ocr_page.refresh_page_images()
+            self._unsaved_pages.add(self.current_page_idx)
+            self._redraw_page_images()
             self.update_images()
 
+        def page_edited_callback():
+            self._unsaved_pages.add(self.current_page_idx)
+
         self.page_editor = IpynbPageEditor(
             current_pgdp_page,
             current_ocr_page,
             self.monospace_font_name,
             page_image_change_callback=page_image_change_callback,
+            page_edited_callback=page_edited_callback,
         )
 
         self.editor_line_matching_vbox = self.page_editor.editor_line_matching_vbox
-        self.editor_ocr_text_vbox = VBox()
-        self.editor_p3_text_vbox = VBox()
-
-        editor_tabs = [
-            (
-                "Matching",
-                self.editor_line_matching_vbox,
-            ),
-            (
-                "OCR Text",
-                self.editor_ocr_text_vbox,
-            ),
-            (
-                "PGDP P3 Text",
-                self.editor_p3_text_vbox,
-            ),
-        ]
-        editor_tab_titles, editor_tab_boxes = zip(*editor_tabs)
+        self.editor_ocr_text_html = HTML()
+        self.editor_ocr_text_vbox = VBox([self.editor_ocr_text_html])
+        self.editor_p3_text_html = HTML()
+        self.editor_p3_text_vbox = VBox([self.editor_p3_text_html])
+
+        editor_tab_titles = (
+            "Matching",
+            "OCR Text",
+            "PGDP P3 Text",
+        )
+        editor_tab_boxes = (
+            self.editor_line_matching_vbox,
+            self.editor_ocr_text_vbox,
+            self.editor_p3_text_vbox,
+        )
 
         self.editor_tab = Tab(children=editor_tab_boxes)
         self.editor_tab.titles = editor_tab_titles
@@ -415,10 +575,61 @@ class IpynbLabeler:
         if self.doctr_predictor:
             # Use the provided doctr predictor if provided
             self.main_ocr_predictor = self.doctr_predictor
+        else:
+            # Otherwise, use the default doctr models (not fine-tuned)
+            self.main_ocr_predictor = get_default_doctr_predictor() # type: ignore[assignment]
+
+        try:
+            self.ocr_device = next(self.main_ocr_predictor.parameters()).device.type
+        except StopIteration:
+            self.ocr_device = "cpu"
+        if self.ocr_device == "cuda" and torch.cuda.is_bf16_supported():
+            # Same speed as fp16 on Ampere+, without fp16's overflow risk
+            self.ocr_autocast_dtype = torch.bfloat16
+
+        # Page shapes are stable, so let cuDNN pick the fastest kernels
+        torch.backends.cudnn.benchmark = True
+        if self.ocr_device == "cuda":
+            self.compile_ocr_models()
+        # A blank page runs only the detector (it finds no words), which is
+        # also the only compiled model, so this absorbs its compile cost
+        self.warm_up_ocr_predictor()
+
+    def compile_ocr_models(self):
+        """Compile the detection model with torch.compile.
+
+        The recognition model stays eager: its batch size is the page's word
+        count, so a compiled version would keep recompiling.
+        """
+        det_predictor = self.main_ocr_predictor.det_predictor
+        if hasattr(det_predictor.model, "_orig_mod"):
+            # Already compiled (e.g. a predictor passed in by the caller)
             return
+        # Batches of pages change the batch size, so compile it as dynamic
+        det_predictor.model = torch.compile(
+            det_predictor.model, dynamic=True, fullgraph=False
+        )
+
+    def _autocast_context(self):
+        """Half precision autocast when the predictor is on the GPU; a no-op on CPU."""
+        return torch.autocast(
+            "cuda", dtype=self.ocr_autocast_dtype, enabled=self.ocr_device == "cuda"
+        )
 
-        # Otherwise, use the default doctr models (not fine-tuned)
-        self.main_ocr_predictor = get_default_doctr_predictor() # type: ignore[assignment]
+    def warm_up_ocr_predictor(self):
+        """Run a dummy page through the predictor so the first real page isn't slow."""
+        logger.debug("Warming up OCR predictor")
+        with self._predictor_lock, torch.inference_mode(), self._autocast_context():
+            self.main_ocr_predictor([np.zeros((1024, 768, 3), dtype=np.uint8)])
+
+    def _run_predictor(self, cv2_numpy_image, source_image: pathlib.Path) -> Page:
+        """OCR a single page image with the main predictor."""
+        with self._predictor_lock, torch.inference_mode(), self._autocast_context():
+            return doctr_ocr_cv2_image(
+                image=cv2_numpy_image,
+                source_image=str(source_image),
+                predictor=self.main_ocr_predictor,
+            )
 
     def create_path(self, str_or_path: pathlib.Path | str) -> pathlib.Path:
         if isinstance(str_or_path, str):
@@ -441,6 +652,21 @@ class IpynbLabeler:
     ):
         self.doctr_predictor = doctr_predictor
         self.pgdp_export = pgdp_export
+        self._dirty = set()
+        self.matched_ocr_pages = OrderedDict()
+        self._matched_ocr_pages_lock = threading.Lock()
+        self._unsaved_pages = set()
+        self._display_image_cache = {}
+        self._stale_paragraph_images = set()
+        self._ocr_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_futures = {}
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = {}
+        self._ocr_json_paths = {}
+        self._missing_ocr_json = set()
+        self._page_locks = {}
+        self._page_locks_guard = threading.Lock()
+        self._predictor_lock = threading.Lock()
 
         self.labeled_ocr_path: pathlib.Path = self.create_path(
             labeled_ocr_path,
@@ -452,25 +678,22 @@ class IpynbLabeler:
             validation_set_output_path,
         )
 
-        self.page_indexby_name = {
-            item.png_file: i for i, item in enumerate(self.pgdp_export.pages)
-        }
-        self.page_indexby_nbr = {
-            i: item.png_file for i, item in enumerate(self.pgdp_export.pages)
-        }
+        self.page_indexby_name = {}
+        self._page_stems = []
+        for i, item in enumerate(self.pgdp_export.pages):
+            self.page_indexby_name[item.png_file] = i
+            self._page_stems.append(
+                os.path.splitext(os.path.basename(item.png_file))[0]
+            )
 
+        # Index of the last page (navigation bounds are inclusive)
         self._total_pages = len(self.pgdp_export.pages) - 1
 
         if start_page_name:
-            new_idx = self.page_indexby_name.get(start_page_name, -1)
-            if new_idx > 0 and new_idx < self.total_pages:
-                self._current_page_idx = start_page_idx
-                self.current_page_name = pathlib.Path(
-                    self.current_pgdp_page.png_file
-                ).stem
-        elif start_page_idx > 0 and start_page_idx < self.total_pages:
+            start_page_idx = self.page_indexby_name.get(start_page_name, -1)
+        if 0 <= start_page_idx <= self.total_pages:
             self._current_page_idx = start_page_idx
-            self.current_page_name = pathlib.Path(self.current_pgdp_page.png_file).stem
+            self.current_page_name = self._page_stems[start_page_idx]
 
         self.init_ocr_doctr_predictor()
         self.init_font(monospace_font_name, monospace_font_path)
@@ -480,7 +703,7 @@ class IpynbLabeler:
 
         self.overall_vbox = VBox(
             [
-                HTML(f"<style>{self._jupyter_css()}</style>"),
+                self._css_html_widget(),
                 self.header_box,
                 self.main_hbox,
                 self.footer_hbox,
@@ -496,8 +719,11 @@ class IpynbLabeler:
 
     @current_page_idx.setter
     def current_page_idx(self, value):
+        # Debounced GT edits belong to the page being left
+        self.page_editor.flush_pending_edits()
         self._current_page_idx = value
-        self.current_page_name = pathlib.Path(self.current_pgdp_page.png_file).stem
+        self.current_page_name = self._page_stems[value]
+        self.mark_dirty(*self.REFRESH_PARTS)
         self.refresh_ui()
 
     @property
@@ -508,6 +734,7 @@ class IpynbLabeler:
     def total_pages(self, value):
         self._total_pages = value
         self.go_to_page_textbox.max = value
+        self.mark_dirty("header")
         self.refresh_ui()
 
     @property
@@ -518,21 +745,20 @@ class IpynbLabeler:
     def current_ocr_page(self) -> Page:
         return self.matched_ocr_pages[self.current_page_idx]["page"]
 
+    def _css_html_widget(self) -> HTML:
+        """The <style> widget for the labeler CSS, shared by all instances."""
+        css_html = f"<style>{self._jupyter_css()}</style>"
+        if IpynbLabeler._css_widget is None:
+            IpynbLabeler._css_widget = HTML(css_html)
+        elif IpynbLabeler._css_widget.value != css_html:
+            IpynbLabeler._css_widget.value = css_html
+        return IpynbLabeler._css_widget
+
     def _jupyter_css(self):
-        # Inject custom CSS for the Jupyter environment
-        css = f"""
-        @font-face {{
-            font-family: '{self.monospace_font_name}';
-            src: url('{self.monospace_font_path}') format('truetype');
-        }}
-
-        input, textarea {{
-            font-family: '{self.monospace_font_name}', monospace !important;
-            font-size: 12px !important;
-        }}
-        """
-        logger.debug("Custom CSS:\n" + css)
-        return css
+        font_path = self.monospace_font_path
+        return _build_jupyter_css(
+            self.monospace_font_name, None if font_path is None else str(font_path)
+        )
 
     def update_header_elements(self):
         self.current_page_idx_display.value = f" #{self.current_page_idx} "
@@ -542,100 +768,179 @@ class IpynbLabeler:
         self.go_to_page_textbox.value = self.current_page_idx
 
     def update_images(self):
-        self.reload_page_images_ui()
+        self._shown_images.clear()
+        self._show_tab_image(self.image_tab.selected_index)
 
-        # w = self.matched_ocr_pages[self.current_page_idx]["width"]
-        # h = self.matched_ocr_pages[self.current_page_idx]["height"]
-        # h = int((w / self.matched_ocr_pages[self.current_page_idx]["width"]) * h)
-        # w = min(400, w)
+    def _on_image_tab_change(self, change):
+        self._show_tab_image(change["new"])
 
-        self.plain_image.value = self.matched_ocr_pages[self.current_page_idx][
-            "page_image"
-        ]
-        # self.plain_image.width = w
-        # self.plain_image.height = h
-
-        self.ocr_image_pgh_bounding_box.value = self.matched_ocr_pages[
-            self.current_page_idx
-        ]["ocr_image_pgh_bounding_box"]
-        # self.ocr_image_pgh_bounding_box.width = w
-        # self.ocr_image_pgh_bounding_box.height = h
-
-        self.ocr_image_lines_bounding_box.value = self.matched_ocr_pages[
-            self.current_page_idx
-        ]["ocr_image_lines_bounding_box"]
-        # self.ocr_image_lines_bounding_box.width = w
-        # self.ocr_image_lines_bounding_box.height = h
-
-        self.ocr_image_words_bounding_box.value = self.matched_ocr_pages[
-            self.current_page_idx
-        ]["ocr_image_words_bounding_box"]
-        # self.ocr_image_words_bounding_box.width = w
-        # self.ocr_image_words_bounding_box.height = h
-
-        self.ocr_image_mismatches.value = self.matched_ocr_pages[self.current_page_idx][
-            "ocr_image_mismatches"
-        ]
-        # self.ocr_image_mismatches.width = w
-        # self.ocr_image_mismatches.height = h
+    def _show_tab_image(self, tab_idx: int | None):
+        """Fill in the parts of one tab that aren't showing the current page yet."""
+        if tab_idx is None:
+            return
+        page_idx = self.current_page_idx
+        if page_idx not in self.matched_ocr_pages:
+            return
+        ocr_page: Page = self.matched_ocr_pages[page_idx]["page"]
+        for name in self._tab_keys[tab_idx]:
+            if name in self._shown_images:
+                continue
+            if name in self._overlay_widgets:
+                self._overlay_widgets[name].value = self._overlay_svg(ocr_page, name)
+            else:
+                image = self._page_image_array(page_idx, ocr_page, name)
+                self._image_widgets[name].value = (
+                    b""
+                    if image is None
+                    else self._encode_page_image(page_idx, name, image)
+                )
+            self._shown_images.add(name)
+
+    def _overlay_svg(self, ocr_page: Page, name: str) -> str:
+        if name == "lines":
+            boxes = (
+                (OVERLAY_LINE_COLOR, line.bounding_box.to_ltrb())
+                for line in ocr_page.lines
+                if line.bounding_box
+            )
+        elif name == "words":
+            boxes = (
+                (OVERLAY_WORD_COLOR, word.bounding_box.to_ltrb())
+                for word in ocr_page.words
+                if word.bounding_box
+            )
+        else:
+            boxes = (
+                (_word_match_color(word), word.bounding_box.to_ltrb())
+                for word in ocr_page.words
+                if word.bounding_box
+            )
+        return _svg_overlay(boxes)
+
+    def _text_table_html(self, numbered_lines) -> str:
+        rows = "".join(
+            self._text_row_template % (escape(str(line_idx)), escape(line))
+            for line_idx, line in numbered_lines
+        )
+        return f'<table class="mono">{rows}</table>'
 
     def update_pgdp_text(self):
-        html_lines = [
-            f"""
-            <tr>
-                <td><span style='font-family:{self.monospace_font_name}; font-size: 12px;'>{line_idx}</span></td>
-                <td><span style='font-family:{self.monospace_font_name}; font-size: 12px;'>{line}</span></td>
-            </tr>
-            """
-            for line_idx, line in self.current_pgdp_page.processed_lines
-        ]
-        html_lines.insert(
-            0,
-            "<table>",
+        self.editor_p3_text_html.value = self._text_table_html(
+            self.current_pgdp_page.processed_lines
         )
-        html_lines.append("</div></table>")
-        self.editor_p3_text_vbox.children = [
-            HTML("\n".join(html_lines)),
-        ]
 
     def update_ocr_text(self):
         logger.debug("Current OCR Text:\n" + self.current_ocr_page.text)
-        html_lines = [
-            f"""
-            <tr>
-                <td><span style='font-family:{self.monospace_font_name}; font-size: 12px;'>{line_idx}</span></td>
-                <td><span style='font-family:{self.monospace_font_name}; font-size: 12px;'>{line}</span></td>
-            </tr>
-            """
-            for line_idx, line in enumerate(
-                self.current_ocr_page.text.splitlines(keepends=True)
-            )
-        ]
-        html_lines.insert(
-            0,
-            "<table>",
+        self.editor_ocr_text_html.value = self._text_table_html(
+            enumerate(self.current_ocr_page.text.splitlines(keepends=True))
         )
-        html_lines.append("</table>")
-        self.editor_ocr_text_vbox.children = [
-            HTML("\n".join(html_lines)),
-        ]
 
     def update_text(self):
         self.update_ocr_text()
         self.update_pgdp_text()
 
+    def mark_dirty(self, *parts: str):
+        """Flag parts of the UI (see REFRESH_PARTS) to update on the next refresh_ui."""
+        self._dirty.update(parts)
+
     def refresh_ui(self):
-        ui_logger.debug("Refreshing UI for page index: " + str(self.current_page_idx))
+        """Update the parts flagged with mark_dirty, or everything if none are."""
+        if self._refreshing:
+            # A widget update re-entered us; leave its flags for the next refresh
+            return
+        dirty = self._dirty or set(self.REFRESH_PARTS)
+        self._dirty = set()
+        self._refreshing = True
+        try:
+            self._refresh_parts(dirty)
+        finally:
+            self._refreshing = False
+
+    def _refresh_parts(self, dirty: set[str]):
+        page_idx = self.current_page_idx
+        ui_logger.debug(f"Refreshing {sorted(dirty)} for page index: {page_idx}")
 
-        self.update_header_elements()
+        if "header" in dirty:
+            self.update_header_elements()
+
+        page_parts = dirty - {"header"}
+        if not page_parts:
+            return
+
+        if self._refresh_future is not None:
+            # Only drops it if it hasn't started; a stale result is ignored anyway
+            self._refresh_future.cancel()
+            self._refresh_future = None
+
+        if not self._page_ocr_ready(page_idx):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self.mark_dirty(*page_parts)
+                self._refresh_ui_pending_ocr(page_idx, loop)
+                return
+
+        self.ocr_status_display.value = ""
         self.run_ocr()
-        self.update_images()
-        self.update_text()
+        if "images" in page_parts:
+            self.update_images()
+        if "text" in page_parts:
+            self.update_text()
+        if "matches" in page_parts:
+            self.page_editor.update_line_matches(
+                self.current_pgdp_page, self.current_ocr_page
+            )
+        ui_logger.debug("UI refreshed for page index: " + str(page_idx))
+
+        self.prefetch_next_page()
+
+    def _page_ocr_ready(self, page_idx: int) -> bool:
+        """Whether the page can be shown without running OCR."""
+        return (
+            page_idx in self.matched_ocr_pages
+            or self._has_saved_ocr(page_idx)
+        )
 
-        self.page_editor.update_line_matches(
-            self.current_pgdp_page, self.current_ocr_page
+    def _refresh_ui_pending_ocr(self, page_idx: int, loop: asyncio.AbstractEventLoop):
+        """Show the page without OCR results and run the OCR in the background."""
+        ui_logger.debug(f"Running OCR in the background for page index: {page_idx}")
+        self.ocr_status_display.value = " Running OCR… "
+        for image in self._image_widgets.values():
+            image.value = b""
+        for overlay in self._overlay_widgets.values():
+            overlay.value = ""
+        self._shown_images.clear()
+        self.editor_ocr_text_html.value = ""
+        self.update_pgdp_text()
+        # Nothing to edit until the OCR page exists
+        self.page_editor.update_line_matches(self.current_pgdp_page, None)
+
+        future = self._prefetch_futures.get(page_idx)
+        if future is None:
+            future = self._ocr_pool.submit(self._ocr_for_idx, page_idx)
+        future.add_done_callback(
+            lambda done: loop.call_soon_threadsafe(
+                self._finish_pending_ocr, page_idx, done
+            )
         )
-        ui_logger.debug("UI refreshed for page index: " + str(self.current_page_idx))
+        self._refresh_future = future
+
+    def _finish_pending_ocr(self, page_idx: int, future: Future):
+        """Runs on the kernel's event loop once background OCR is done."""
+        if future is self._refresh_future:
+            self._refresh_future = None
+        if future.cancelled() or page_idx != self.current_page_idx:
+            # The user has moved on to another page
+            return
+        try:
+            future.result()
+        except Exception:
+            logger.exception(f"OCR failed for page index: {page_idx}")
+            self.ocr_status_display.value = " OCR failed, see log "
+            return
+        self.refresh_ui()
 
     # Navigation Buttons
     def prev_page(self, event=None):
@@ -651,45 +956,82 @@ class IpynbLabeler:
     def go_to_page(self, event=None):
         go_to_page_idx = self.go_to_page_textbox.value
         ui_logger.debug(f"Going to page index: {go_to_page_idx}")
-        if go_to_page_idx < self.total_pages and go_to_page_idx >= 0:
+        if 0 <= go_to_page_idx <= self.total_pages:
             self.current_page_idx = go_to_page_idx
 
-    def reload_page_images_ui(self):
-        logger.debug(f"Reloading page images for page index: {self.current_page_idx}")
-        ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
+    def _invalidate_page_images(self, page_idx: int):
+        """Drop the cached encoded images for a page so they are re-encoded."""
+        self._display_image_cache.pop(page_idx, None)
+
+    def _encode_page_image(self, page_idx: int, name: str, image) -> bytes | None:
+        """Encode a page image, reusing the cached bytes if the array is unchanged."""
+        if image is None:
+            return None
+        page_cache = self._display_image_cache.setdefault(page_idx, {})
+        # Same array object viewing the same buffer the same way; O(1), no copy
+        key = (
+            id(image),
+            image.__array_interface__["data"][0],
+            image.shape,
+            image.strides,
+        )
+        cached = page_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        encoded = _encode_for_display(image)
+        page_cache[name] = (key, encoded)
+        return encoded
+
+    def _encode_page_images(self, page_idx: int) -> dict[str, bytes | None]:
+        logger.debug(f"Reloading page images for page index: {page_idx}")
+        ocr_page: Page = self.matched_ocr_pages[page_idx]["page"]
         if ocr_page.cv2_numpy_page_image is None:
             raise ValueError(
                 "Current OCR page does not have a valid image."
             )
-        self.matched_ocr_pages[self.current_page_idx] = {
-            **self.matched_ocr_pages[self.current_page_idx],
-            "width": ocr_page.cv2_numpy_page_image.shape[1],
-            "height": ocr_page.cv2_numpy_page_image.shape[0],
-            "page_image": encode_bgr_image_as_png(ocr_page.cv2_numpy_page_image),
-            "ocr_image_words_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_word_with_bboxes
-            ) if ocr_page.cv2_numpy_page_image_word_with_bboxes is not None else None,
-            "ocr_image_mismatches": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_matched_word_with_colors
-            ) if ocr_page.cv2_numpy_page_image_matched_word_with_colors is not None else None,
-            "ocr_image_lines_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_line_with_bboxes
-            ) if ocr_page.cv2_numpy_page_image_line_with_bboxes is not None else None,
-            "ocr_image_pgh_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_paragraph_with_bboxes
-            ) if ocr_page.cv2_numpy_page_image_paragraph_with_bboxes is not None else None,
+        images = {
+            name: self._page_image_array(page_idx, ocr_page, name)
+            for name in ("page_image", "ocr_image_pgh_bounding_box")
+        }
+        # cv2 releases the GIL while encoding, so the images encode in parallel
+        futures = {
+            ENCODE_POOL.submit(self._encode_page_image, page_idx, name, image): name
+            for name, image in images.items()
+            if image is not None
         }
+        encoded = dict.fromkeys(images)
+        for future in as_completed(futures):
+            encoded[futures[future]] = future.result()
+        return encoded
+
+    def _page_image_array(self, page_idx: int, ocr_page: Page, name: str):
+        # Paragraphs stay rasterized; the other boxes are SVG overlays
+        if name == "page_image":
+            return ocr_page.cv2_numpy_page_image
+        if page_idx in self._stale_paragraph_images:
+            # Page only redraws all of its box rasters at once, so this is
+            # put off until the paragraph tab is actually shown
+            ocr_page.refresh_page_images()
+            self._stale_paragraph_images.discard(page_idx)
+        return ocr_page.cv2_numpy_page_image_paragraph_with_bboxes
+
+    def _redraw_page_images(self):
+        """Mark the paragraph raster stale and drop the encoded images.
+
+        The SVG overlays are rebuilt from the page when next shown, so
+        nothing is drawn here.
+        """
+        self._stale_paragraph_images.add(self.current_page_idx)
+        self._invalidate_page_images(self.current_page_idx)
 
     def refresh_page_images(self):
         """Refresh the page images for the current page."""
         ui_logger.debug(f"Refreshing page images for page index: {self.current_page_idx}")
-        ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
         
-        # Regenerate all the page images with bounding boxes
-        ocr_page.refresh_page_images()
+        # Redraw the bounding boxes from the current page data
+        self._redraw_page_images()
         
         # Update the UI with the new images
-        self.reload_page_images_ui()
         self.update_images()
 
     def refresh_all_line_images(self):
@@ -708,31 +1050,133 @@ class IpynbLabeler:
         """Expand the bounding boxes of all words in the current OCR page."""
         ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
 
+        page_image = ocr_page.cv2_numpy_page_image
+        if page_image is None:
+            raise ValueError(
+                "Current OCR page does not have a valid image to refine bounding boxes."
+            )
+
         ui_logger.debug("Expanding all word bounding boxes to content and beyond.")
+        debug_enabled = logger.isEnabledFor(logging_DEBUG)
         for word in ocr_page.words:
-            logger.debug(
-                f"Refining word bounding box for word: {word.text} with bbox: {word.bounding_box}"
-            )
-            if ocr_page.cv2_numpy_page_image is None:
-                raise ValueError(
-                    "Current OCR page does not have a valid image to refine bounding boxes."
+            if debug_enabled:
+                logger.debug(
+                    f"Refining word bounding box for word: {word.text} with bbox: {word.bounding_box}"
                 )
             word.bounding_box = word.bounding_box.crop_bottom(
-                image=ocr_page.cv2_numpy_page_image
-            )
-            word.bounding_box = word.bounding_box.expand_to_content(
-                image=ocr_page.cv2_numpy_page_image
-            )
+                image=page_image
+            ).expand_to_content(image=page_image)
 
         ocr_page.refine_bounding_boxes(padding_px=2)
+        self._unsaved_pages.add(self.current_page_idx)
+        self._redraw_page_images()
+        self.mark_dirty("images", "matches")
         self.refresh_ui()
 
     def refine_all_bboxes(self):
         """Refine the bounding boxes of all words in the current OCR page."""
         ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
         ocr_page.refine_bounding_boxes(padding_px=2)
+        self._unsaved_pages.add(self.current_page_idx)
+        self._redraw_page_images()
+        self.mark_dirty("images", "matches")
         self.refresh_ui()
 
+    def _store_ocr_page(self, page_idx: int, ocr_page: Page):
+        """Cache an OCR page, evicting the least recently used saved pages."""
+        with self._matched_ocr_pages_lock:
+            self.matched_ocr_pages[page_idx] = {
+                "page": ocr_page,
+            }
+            self.matched_ocr_pages.move_to_end(page_idx)
+            self._unsaved_pages.discard(page_idx)
+            self._stale_paragraph_images.discard(page_idx)
+            self._invalidate_page_images(page_idx)
+
+            excess = len(self.matched_ocr_pages) - self.max_cached_pages
+            evictable = [
+                idx
+                for idx in self.matched_ocr_pages
+                if idx != self.current_page_idx
+                and idx not in self._unsaved_pages
+                and not self._save_pending(idx)
+                # Still being prefetched; its images are encoded after it is stored
+                and idx not in self._prefetch_futures
+            ]
+            for idx in evictable[: max(excess, 0)]:
+                logger.debug(f"Evicting OCR page index {idx} from the page cache")
+                del self.matched_ocr_pages[idx]
+                self._stale_paragraph_images.discard(idx)
+                self._invalidate_page_images(idx)
+
+    def _touch_ocr_page(self, page_idx: int):
+        with self._matched_ocr_pages_lock:
+            if page_idx in self.matched_ocr_pages:
+                self.matched_ocr_pages.move_to_end(page_idx)
+
+    def _page_lock(self, page_idx: int) -> threading.Lock:
+        """Lock guarding the OCR of a single page (shared with the prefetcher)."""
+        with self._page_locks_guard:
+            return self._page_locks.setdefault(page_idx, threading.Lock())
+
+    def _ocr_for_idx(self, page_idx: int, force_refresh_ocr=False):
+        """Run OCR for a page and store it, unless it is already loaded."""
+        with self._page_lock(page_idx):
+            if page_idx in self.matched_ocr_pages and not force_refresh_ocr:
+                return
+
+            source_image = self.pgdp_export.pages[page_idx].png_full_path
+            cv2_numpy_image = decode_image(source_image)
+
+            # Always 1 page per OCR in this case
+            ocr_page: Page = self._run_predictor(cv2_numpy_image, source_image)
+            self._finish_ocr_page(page_idx, ocr_page, cv2_numpy_image)
+
+    def _ocr_batch(self, page_indices: list[int]):
+        """OCR several pages with a single predictor call and store them."""
+        page_indices = sorted(page_indices)
+        with ExitStack() as stack:
+            # Always lock in page order so concurrent callers can't deadlock
+            for page_idx in page_indices:
+                stack.enter_context(self._page_lock(page_idx))
+            page_indices = [
+                idx for idx in page_indices if idx not in self.matched_ocr_pages
+            ]
+            if not page_indices:
+                return
+
+            source_images = [
+                self.pgdp_export.pages[idx].png_full_path for idx in page_indices
+            ]
+            cv2_numpy_images = [decode_image(source) for source in source_images]
+
+            with self._predictor_lock, torch.inference_mode(), self._autocast_context():
+                ocr_pages = batch_doctr_ocr_cv2_images(
+                    self.main_ocr_predictor, cv2_numpy_images, source_images
+                )
+
+            for page_idx, ocr_page, cv2_numpy_image in zip(
+                page_indices, ocr_pages, cv2_numpy_images
+            ):
+                self._finish_ocr_page(page_idx, ocr_page, cv2_numpy_image)
+
+    def _finish_ocr_page(self, page_idx: int, ocr_page: Page, cv2_numpy_image):
+        # The predictor only reads the image, so reuse the decoded array
+        ocr_page.cv2_numpy_page_image = cv2_numpy_image
+
+        ui_logger.debug(
+            f"OCR Completed for page index {page_idx}. Page text length: {len(ocr_page.text)} characters."
+        )
+
+        ocr_page.reorganize_page()
+
+        ui_logger.debug("OCR Reorganized.")
+
+        ocr_page.add_ground_truth(self.pgdp_export.pages[page_idx].processed_page_text)
+        ui_logger.debug("Ground Truth Added.")
+
+        self._store_ocr_page(page_idx, ocr_page)
+
     def run_ocr(self, force_refresh_ocr=False):
         """Run OCR or get saved OCR document dict and update the current page
         If the OCR document is already saved, it will be imported and used.
@@ -741,48 +1185,89 @@ class IpynbLabeler:
         ui_logger.debug(
             f"Running OCR for page index: {self.current_page_idx}, force_refresh_ocr: {force_refresh_ocr}"
         )
-        # Import the saved label data if it exists
-        self.import_ocr_document()
-
-        if (
-            self.current_page_idx not in self.matched_ocr_pages.keys()
-            or force_refresh_ocr
-        ):
-            source_image = self.current_pgdp_page.png_full_path
-
-            cv2_numpy_image = cv2.imread(str(source_image.resolve()))
+        # Import the saved label data if it exists, unless the page is already
+        # loaded (possibly with unsaved edits); "Reload OCR from File" forces it
+        page_idx = self.current_page_idx
+        if page_idx not in self.matched_ocr_pages and self._has_saved_ocr(page_idx):
+            self.import_ocr_document()
 
-            # Always 1 page per OCR in this case
-            ocr_page: Page = doctr_ocr_cv2_image(
-                image=cv2_numpy_image,
-                source_image=str(source_image),
-                predictor=self.main_ocr_predictor,
-            )
-            ocr_page.cv2_numpy_page_image = cv2.imread(str(source_image.resolve()))
+        self._wait_for_prefetch(self.current_page_idx)
+        self._ocr_for_idx(self.current_page_idx, force_refresh_ocr)
+        self._touch_ocr_page(self.current_page_idx)
 
-            ui_logger.debug(
-                f"OCR Completed. Page text length: {len(ocr_page.text)} characters."
+    def _prefetch_pages(self, page_indices: list[int]):
+        """OCR pages and encode their images so they are ready when navigated to."""
+        try:
+            self._ocr_batch(page_indices)
+            for page_idx in page_indices:
+                # Skip a page evicted meanwhile instead of failing the rest
+                if page_idx in self.matched_ocr_pages:
+                    self._encode_page_images(page_idx)
+        except Exception:
+            logger.exception(f"Prefetching failed for page indices: {page_indices}")
+
+    def prefetch_next_page(self):
+        """Prefetch the next few pages that have neither OCR nor a saved file."""
+        page_indices = [
+            page_idx
+            for page_idx in range(
+                self.current_page_idx + 1,
+                min(self.current_page_idx + self.prefetch_page_count, self.total_pages)
+                + 1,
             )
+            if page_idx not in self.matched_ocr_pages
+            and page_idx not in self._prefetch_futures
+            # Saved pages are imported when navigated to; nothing to OCR
+            and not self._has_saved_ocr(page_idx)
+        ]
+        if not page_indices:
+            return
+        logger.debug(f"Prefetching page indices: {page_indices}")
+        future = self._ocr_pool.submit(self._prefetch_pages, page_indices)
+        for page_idx in page_indices:
+            self._prefetch_futures[page_idx] = future
 
-            ocr_page.reorganize_page()
+        def forget_prefetch(_):
+            for page_idx in page_indices:
+                self._prefetch_futures.pop(page_idx, None)
 
-            ui_logger.debug("OCR Reorganized.")
+        future.add_done_callback(forget_prefetch)
 
-            ocr_page.add_ground_truth(self.current_pgdp_page.processed_page_text)
-            ui_logger.debug("Ground Truth Added.")
-
-            self.matched_ocr_pages[self.current_page_idx] = {
-                "page": ocr_page,
-            }
+    def _wait_for_prefetch(self, page_idx: int):
+        future = self._prefetch_futures.get(page_idx)
+        if future is not None and not future.cancelled():
+            future.result()
 
     def reset_ocr(self, event=None):
         # Reset the OCR for the current page and refresh the UI
         self.run_ocr(force_refresh_ocr=True)
+        self.mark_dirty("images", "text", "matches")
         self.refresh_ui()
 
+    def _export_prefix(self, page_idx: int) -> str:
+        return f"{self.pgdp_export.project_id}_{page_idx}"
+
     @property
     def export_prefix(self):
-        return f"{self.pgdp_export.project_id}_{self.current_page_idx}"
+        return self._export_prefix(self.current_page_idx)
+
+    def _ocr_json_path(self, page_idx: int) -> pathlib.Path:
+        path = self._ocr_json_paths.get(page_idx)
+        if path is None:
+            path = pathlib.Path(
+                self.labeled_ocr_path, f"{self._export_prefix(page_idx)}.json"
+            )
+            self._ocr_json_paths[page_idx] = path
+        return path
+
+    def _has_saved_ocr(self, page_idx: int) -> bool:
+        """Whether a saved OCR JSON exists for the page (misses are remembered)."""
+        if page_idx in self._missing_ocr_json:
+            return False
+        if self._ocr_json_path(page_idx).exists():
+            return True
+        self._missing_ocr_json.add(page_idx)
+        return False
 
     def export_validations(self, event=None):
         # Save the current page
@@ -802,11 +1287,13 @@ class IpynbLabeler:
 
     def export_ocr_document(self, event=None):
         """Export a dict of the current OCR document to a file"""
-        if self.current_page_idx not in self.matched_ocr_pages:
+        page_idx = self.current_page_idx
+        if page_idx not in self.matched_ocr_pages:
             logger.error("No OCR page to save.")
             return
+        self._wait_for_save(page_idx)
 
-        ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
+        ocr_page: Page = self.matched_ocr_pages[page_idx]["page"]
         ocr_image_path = self.current_pgdp_page.png_full_path
 
         # copy the image to the labeled OCR path
@@ -814,30 +1301,63 @@ class IpynbLabeler:
             self.labeled_ocr_path, f"{self.export_prefix}.png"
         )
 
+        # The I/O pool writes a snapshot, so edits made meanwhile can't end up
+        # half-written. The large image arrays are shared, not copied; only
+        # the words and boxes are edited
+        page_arrays = {
+            id(value): value
+            for value in getattr(ocr_page, "__dict__", {}).values()
+            if isinstance(value, np.ndarray)
+        }
         ocr_document: Document = Document(
-            pages=[ocr_page],
+            pages=[copy.deepcopy(ocr_page, page_arrays)],
             source_lib="doctr-pgdp-labeled",
             source_path=target_image_path,
         )
 
-        target_path = pathlib.Path(self.labeled_ocr_path, f"{self.export_prefix}.json")
+        target_path = self._ocr_json_path(page_idx)
 
-        logger.info(f"Exporting OCR document to {target_path}")
-        ocr_document.to_json_file(target_path)
+        # Edits from now on mark the page unsaved again; a failed write does too
+        self._unsaved_pages.discard(page_idx)
 
+        logger.info(f"Exporting OCR document to {target_path}")
         logger.info(f"Copying OCR image to {target_image_path}")
-        copyfile(ocr_image_path, target_image_path)
+        saves = [
+            self._io_pool.submit(ocr_document.to_json_file, target_path),
+            self._io_pool.submit(copyfile, ocr_image_path, target_image_path),
+        ]
+        for future in saves:
+            future.add_done_callback(partial(self._on_save_done, page_idx))
+        self._pending_saves[page_idx] = saves
+        self._missing_ocr_json.discard(page_idx)
+
+    def _on_save_done(self, page_idx: int, future: Future):
+        if future.exception() is not None:
+            logger.error("Saving OCR page failed", exc_info=future.exception())
+            self._unsaved_pages.add(page_idx)
+
+    def _save_pending(self, page_idx: int) -> bool:
+        """Whether the page's last export is still being written."""
+        return not all(
+            future.done() for future in self._pending_saves.get(page_idx, ())
+        )
+
+    def _wait_for_save(self, page_idx: int):
+        """Block until the page's previous export has finished writing."""
+        # Failures are logged by _on_save_done, so only wait here
+        wait(self._pending_saves.pop(page_idx, ()))
 
     def import_ocr_document(self):
         """Import an OCR document from a JSON file and update the current page"""
-        ocr_json_path = pathlib.Path(
-            self.labeled_ocr_path, f"{self.export_prefix}.json"
-        )
+        ocr_json_path = self._ocr_json_path(self.current_page_idx)
         logger.debug(f"Importing OCR document from {ocr_json_path}")
+        self._wait_for_save(self.current_page_idx)
 
         if not ocr_json_path.exists():
             logger.error(f"OCR JSON file does not exist: {ocr_json_path}")
+            self._missing_ocr_json.add(self.current_page_idx)
             return
+        self._missing_ocr_json.discard(self.current_page_idx)
 
         ocr_document: Document = Document.from_json_file(ocr_json_path)
         if len(ocr_document.pages) != 1:
@@ -851,11 +1371,9 @@ class IpynbLabeler:
             logger.error("OCR document does not contain a source image path.")
             raise ValueError("OCR document does not contain a source image path.")
             return
-        ocr_page.cv2_numpy_page_image = cv2.imread(str(source_image.resolve()))
+        ocr_page.cv2_numpy_page_image = decode_image(source_image)
 
-        self.matched_ocr_pages[self.current_page_idx] = {
-            "page": ocr_page,
-        }
+        self._store_ocr_page(self.current_page_idx, ocr_page)
 
     def display(self):
         # Inject custom CSS for the Jupyter environment monospacing the fonts
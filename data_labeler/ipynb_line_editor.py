@@ -1,20 +1,20 @@
+import asyncio
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, lru_cache, partial, wraps
 from logging import getLogger
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional
 
-from cv2 import line as cv2_line
-from ipywidgets import HTML, Button, HBox, Layout, Text, VBox, Label
+from ipywidgets import HTML, Button, HBox, Layout, Text, TextStyle, VBox, Label
 from ipywidgets import Image as ipywidgets_Image
-from numpy import ndarray  # GridBox,
+from numpy import array, clip, int32, ndarray, zeros  # GridBox,
 
 from pd_book_tools.geometry.bounding_box import BoundingBox
 from pd_book_tools.ocr.block import Block
 from pd_book_tools.ocr.ground_truth_matching import update_line_with_ground_truth
-from pd_book_tools.ocr.image_utilities import (
-    get_cropped_encoded_image_scaled_bbox,
-    get_cropped_word_image,
-    get_encoded_image,
-)
 from pd_book_tools.ocr.page import Page
 from pd_book_tools.ocr.word import Word
 from pd_book_tools.pgdp.pgdp_results import PGDPPage
@@ -24,17 +24,180 @@ from pd_book_tools.utility.ipynb_widgets import (
     get_html_widget_from_cropped_image,
 )
 
+from .image_encoding import ENCODE_POOL, get_encoded_preview_image
+
 # Configure logging
 logger = getLogger(__name__)
 ui_logger = getLogger(__name__ + ".UI")
 
 
+def debounce(wait: float):
+    """Run a method only once its calls have paused for `wait` seconds.
+
+    Bursts of calls (e.g. repeated arrow-button clicks) collapse into the
+    last one. Outside a running event loop the method runs immediately.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def debounced(self, *args, **kwargs):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return fn(self, *args, **kwargs)
+            handles = self.__dict__.setdefault("_debounce_handles", {})
+            pending = handles.get(fn.__name__)
+            if pending is not None:
+                pending.cancel()
+            handles[fn.__name__] = loop.call_later(
+                wait, partial(fn, self, *args, **kwargs)
+            )
+
+        return debounced
+
+    return decorator
+
+
+# Refined/expanded boxes per page image (by id, dropped with the image).
+# The page image doesn't change while it is edited, so a box always
+# refines/expands to the same result
+_bbox_results: dict[int, OrderedDict] = {}
+BBOX_RESULTS_PER_IMAGE = 256
+
+
+def _image_results(store: dict[int, OrderedDict], image: ndarray) -> OrderedDict:
+    results = store.get(id(image))
+    if results is None:
+        results = store[id(image)] = OrderedDict()
+        weakref.finalize(image, store.pop, id(image), None)
+    return results
+
+
+def _cached_bbox_result(image: ndarray, key: tuple, compute: Callable) -> BoundingBox:
+    results = _image_results(_bbox_results, image)
+    result = results.get(key)
+    if result is None:
+        result = results[key] = compute()
+        if len(results) > BBOX_RESULTS_PER_IMAGE:
+            results.popitem(last=False)
+    else:
+        results.move_to_end(key)
+    return result
+
+
+def refine_cached(image: ndarray, bbox: BoundingBox, padding_px: int) -> BoundingBox:
+    """BoundingBox.refine, memoized per page image."""
+    return _cached_bbox_result(
+        image,
+        ("refine", tuple(bbox.to_ltrb()), padding_px),
+        lambda: bbox.refine(image, padding_px=padding_px),
+    )
+
+
+def expand_to_content_cached(image: ndarray, bbox: BoundingBox) -> BoundingBox:
+    """BoundingBox.expand_to_content, memoized per page image."""
+    return _cached_bbox_result(
+        image,
+        ("expand_to_content", tuple(bbox.to_ltrb())),
+        lambda: bbox.expand_to_content(image=image),
+    )
+
+
+@cache
+def _gt_text_layout(width: int) -> Layout:
+    return Layout(width=f"{width}px", padding="0px", margin="0px")
+
+
+def gt_text_layout(text_length: int) -> Layout:
+    """Shared layout for a ground truth box of `text_length` characters.
+
+    Widths are rounded up to 20px so a handful of Layouts serve every box.
+    """
+    width = max(text_length * 9 + 16, 100)
+    return _gt_text_layout(-(-width // 20) * 20)
+
+
+# (OCR text, ground truth text) colors of a word match in the table
+UNMATCHED_WORD_COLORS = ("red", "lightgray")
+MISMATCHED_WORD_COLORS = ("blue", "blue")
+MATCHED_WORD_COLORS = ("lightgray", "lightgray")
+
+# Word text spans by (color, text, font). The HTML widgets are shared by
+# every table showing that text, so they must not be modified
+word_text_span = lru_cache(maxsize=1024)(get_formatted_text_html_span)
+
+
+# Encoded word crops per page image, keyed by the word's box: a crop only
+# changes when its box does, so merges/splits/bbox edits miss naturally
+_word_crops: dict[int, OrderedDict] = {}
+WORD_CROPS_PER_IMAGE = 1024
+
+
+def _encode_word_crop(crop: ndarray) -> tuple[str | None, str | None]:
+    if crop.size == 0:
+        return None, None
+    data_src_string = get_encoded_preview_image(crop)
+    img_tag_text = get_html_string_from_image_src(
+        data_src_string=data_src_string, height="height: 14px;"
+    )
+    return data_src_string, img_tag_text
+
+
+def word_crops_cached(
+    image: ndarray, words: list[Word], wait: bool = True
+) -> tuple[list[tuple[str | None, str | None]], dict[tuple, Future]]:
+    """(data_src_string, img_tag_text) of each word's crop, memoized per page image.
+
+    Crops that aren't cached yet are sliced out of the page in one pass and
+    encoded together on ENCODE_POOL. Without `wait`, crops still encoding
+    come back as (None, None) and their futures are returned by box.
+    """
+    results = _image_results(_word_crops, image)
+    keys = [tuple(word.bounding_box.to_ltrb()) for word in words]
+    missing = list(dict.fromkeys(key for key in keys if key not in results))
+    if missing:
+        h, w = image.shape[:2]
+        pixel_boxes = (array(missing) * (w, h, w, h)).astype(int32)
+        for key, (left, top, right, bottom) in zip(missing, pixel_boxes):
+            # In-flight encodes are cached as their Future so they aren't resubmitted
+            results[key] = ENCODE_POOL.submit(
+                _encode_word_crop, image[top:bottom, left:right]
+            )
+    encoded = []
+    pending = {}
+    for key in keys:
+        results.move_to_end(key)
+        result = results[key]
+        if isinstance(result, Future):
+            if wait or result.done():
+                result = results[key] = result.result()
+            else:
+                pending[key] = result
+                result = (None, None)
+        encoded.append(result)
+    while len(results) > WORD_CROPS_PER_IMAGE:
+        results.popitem(last=False)
+    return encoded, pending
+
+
 class EditorTaskType(Enum):
     NONE = 0
     SPLIT = 1
     EDITBBOX = 2
 
 
+@dataclass
+class EditorTaskState:
+    """A line editor's active task and the positions it is editing."""
+
+    type: EditorTaskType = EditorTaskType.NONE
+    match_idx: int = -1
+    # Left, Top, Right, Bottom pixel offsets of the edit bbox task
+    edit_margins: ndarray = field(default_factory=lambda: zeros(4, dtype=int32))
+    split_x_coordinate: int = -1
+    split_word_split_idx: int = -1
+
+
 class IpynbLineEditor:
     """
     UI editing a single line
@@ -47,8 +210,11 @@ class IpynbLineEditor:
     line_matches: list[dict]
     page_image_change_callback: Optional[Callable] = None
     line_change_callback: Optional[Callable] = None
+    # Called right away on edits whose redraw is debounced
+    page_edited_callback: Optional[Callable] = None
 
     monospace_font_name: str
+    monospace_text_style: TextStyle
 
     GridVBox: VBox
     line_image: ipywidgets_Image
@@ -58,12 +224,38 @@ class IpynbLineEditor:
     LineActionButtonsHBox: HBox
     WordMatchingTableHBox: HBox
     WordMatchingTableVBoxes: list[VBox]
+    # Word match widgets by match idx, reused across redraws:
+    # {"vbox", "image_HTML", "ocr_HBox", "gt_TextBox", "match", "last_hash"}
+    _match_widget_cache: dict[int, dict]
+    # Set while a redraw writes a ground truth box, so it isn't taken as an edit
+    _suppress_gt_observer: bool = False
+    # Words whose ground truth was edited but not yet rescored, by id
+    _pending_gt_words: dict[int, Word]
+    # Callbacks (attribute names) requested by the current action, in order
+    _pending_callbacks: dict[str, None]
     TaskHBox: HBox
+    # Task toolbars, built on first use and kept for later tasks
+    SplitVBox: VBox | None = None
+    EditHBox: HBox | None = None
+
+    # Last (key, widget) drawn for the line image and line texts; redraws
+    # that don't change the key reuse the widget instead of re-encoding
+    _line_image_cache: tuple | None = None
+    _ocr_html_cache: tuple | None = None
+    _gt_html_cache: tuple | None = None
+
+    # Page image size in pixels, read once per editor
+    _page_h: int
+    _page_w: int
+
+    # Set by anything that changes the line's words or ground truth, so
+    # redraws that don't (e.g. marking validated) keep the current matches
+    _line_matches_dirty: bool = True
+    # render_fingerprint() of the last line section drawn
+    _last_render_fingerprint: int | None = None
 
-    task_type: EditorTaskType = EditorTaskType.NONE
-    task_match_idx: int = -1
-    split_task_x_coordinate: int = -1
-    split_task_word_split_idx: int = -1
+    # The active task; replaced as a whole when a task starts or ends
+    task: EditorTaskState
 
     basic_box_layout: Layout = Layout(
         margin="0px",
@@ -87,6 +279,32 @@ class IpynbLineEditor:
         padding="0px",
         border="3px solid green",
     )
+    hidden_editor_layout: Layout = Layout(display="none")
+
+    # Shared by the word matching table's buttons
+    word_delete_button_layout: Layout = Layout(width="16px", padding="0px", margin="0px")
+    word_action_button_layout: Layout = Layout(width="22px", padding="0px", margin="0px")
+    word_crop_button_layout: Layout = Layout(width="22px", padding="0px", margin="0px 1px")
+    # Shared by the word matching table's boxes; the button rows swap
+    # layouts to hide while a task is active
+    word_match_vbox_layout: Layout = Layout(padding="0px", margin="0px", flex="0 0 auto")
+    word_buttons_layout: Layout = Layout(flex_wrap="wrap")
+    word_buttons_hidden_layout: Layout = Layout(flex_wrap="wrap", display="none")
+
+    # Word button action -> method called with the button's match
+    word_button_actions: ClassVar[dict[str, str]] = {
+        "delete": "delete_match",
+        "merge_left": "merge_left",
+        "merge_right": "merge_right",
+        "edit_bbox": "start_edit_bbox_task",
+        "split": "start_split_task",
+        "crop_top": "crop_word_top",
+        "crop_bottom": "crop_word_bottom",
+        "crop_both": "crop_word_both",
+    }
+
+    # Buttons by role, reused across redraws: role -> (button, click handler)
+    _button_pool: dict
 
     def __init__(
         self,
@@ -96,39 +314,162 @@ class IpynbLineEditor:
         page_image_change_callback: Optional[Callable] = None,
         line_change_callback: Optional[Callable] = None,
         monospace_font_name: str = "monospace",
+        page_edited_callback: Optional[Callable] = None,
     ):
         self.monospace_font_name = monospace_font_name
+        # One style widget shared by all of this editor's ground truth boxes
+        self.monospace_text_style = TextStyle(
+            **{"font-family": self.monospace_font_name}
+        )
 
         self.GridVBox = VBox()
         self.GridVBox.children = []
         self.GridVBox.layout = self.gray_editor_layout
+        # The line section's boxes persist; redraws only replace their children
+        self.LineImageHBox = HBox(layout=self.basic_box_layout)
+        self.OcrLineTextHBox = HBox(layout=self.basic_box_layout)
+        self.GTLineTextHBox = HBox(layout=self.basic_box_layout)
+        self.LineActionButtonsHBox = HBox(layout=self.basic_box_layout)
+        self.TaskHBox = HBox()
+        self.TaskHBox.layout = self.basic_box_layout
+        self._button_pool = {}
+        self.WordMatchingTableHBox = HBox()
+        self.WordMatchingTableVBoxes = []
+        self._match_widget_cache = {}
+        self._pending_gt_words = {}
+        self._pending_callbacks = {}
+        self.task = EditorTaskState()
 
         self._current_ocr_page = page
+        # Edits only move boxes; the page image (and its size) stays the same
+        if page.cv2_numpy_page_image is not None:
+            self._page_h, self._page_w = page.cv2_numpy_page_image.shape[:2]
         self._current_pgdp_page = pgdp_page
         self._current_ocr_line = line
         self.line_matches = []
         self.page_image_change_callback = page_image_change_callback
         self.line_change_callback = line_change_callback
+        self.page_edited_callback = page_edited_callback
 
         self.redraw_ui()
 
+    @property
+    def task_type(self) -> EditorTaskType:
+        return self.task.type
+
+    @property
+    def task_match_idx(self) -> int:
+        return self.task.match_idx
+
+    @property
+    def edit_margins(self) -> ndarray:
+        return self.task.edit_margins
+
+    @edit_margins.setter
+    def edit_margins(self, value: ndarray):
+        self.task.edit_margins = value
+
+    @property
+    def split_task_x_coordinate(self) -> int:
+        return self.task.split_x_coordinate
+
+    @split_task_x_coordinate.setter
+    def split_task_x_coordinate(self, value: int):
+        self.task.split_x_coordinate = value
+
+    @property
+    def split_task_word_split_idx(self) -> int:
+        return self.task.split_word_split_idx
+
+    @split_task_word_split_idx.setter
+    def split_task_word_split_idx(self, value: int):
+        self.task.split_word_split_idx = value
+
+    def schedule_callback(self, name: str):
+        """Call the callback attribute `name` once the current action is done.
+
+        Requests made during one action are coalesced, so each callback fires
+        once per action. Outside a running event loop it is called right away.
+        """
+        if getattr(self, name) is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            getattr(self, name)()
+            return
+        if not self._pending_callbacks:
+            loop.call_soon(self.flush_callbacks)
+        self._pending_callbacks[name] = None
+
+    def flush_callbacks(self):
+        names = list(self._pending_callbacks)
+        self._pending_callbacks.clear()
+        for name in names:
+            callback = getattr(self, name)
+            if callback is not None:
+                callback()
+
     def redraw_ui(self):
-        ui_logger.debug(f"Redrawing UI for line: {self._current_ocr_line.text[:20]}...")
-        self.calculate_line_matches()
+        ui_logger.debug("Redrawing UI for line: %s...", self._current_ocr_line.text[:20])
+        fingerprint = self.render_fingerprint()
+        if fingerprint == self._last_render_fingerprint:
+            ui_logger.debug("Line unchanged since the last redraw.")
+            shown = bool(self.line_matches)
+        else:
+            shown = self.redraw_line_section()
+            self._last_render_fingerprint = fingerprint
+        if shown:
+            self.redraw_task_section()
+
+    def render_fingerprint(self) -> int:
+        """Hash of everything about the line that the line section shows."""
+        line = self._current_ocr_line
+        attributes = line.additional_block_attributes or {}
+        return hash(
+            (
+                line.text,
+                line.ground_truth_text,
+                line.ground_truth_exact_match,
+                tuple(
+                    (
+                        word.text,
+                        word.ground_truth_text,
+                        word.ground_truth_match_keys.get("match_score"),
+                        tuple(word.bounding_box.to_ltrb()) if word.bounding_box else None,
+                    )
+                    for word in line.items
+                ),
+                tuple(map(tuple, line.unmatched_ground_truth_words or ())),
+                attributes.get("line_editor_validated"),
+            )
+        )
+
+    def redraw_task_section(self):
+        """Redraw the task bar only; starting or cancelling a task doesn't change the line."""
+        self.draw_ui_active_task()
+        self.show_word_buttons(self.task_type == EditorTaskType.NONE)
+
+    def redraw_line_section(self) -> bool:
+        """Redraw everything but the task bar; False if the line has nothing to show."""
+        if self._line_matches_dirty:
+            self.calculate_line_matches()
+            self._line_matches_dirty = False
         if not self.line_matches:
             ui_logger.debug(
-                f"Line {self._current_ocr_line.text} has no matches. Hiding UI."
+                "Line %s has no matches. Hiding UI.", self._current_ocr_line.text
             )
             # If there are no matches, don't display the UI
-            self.GridVBox.children = []
-            self.GridVBox.layout = Layout(display="none")
-            return
+            with self.GridVBox.hold_sync():
+                self.GridVBox.children = []
+                self.GridVBox.layout = self.hidden_editor_layout
+            return False
         else:
-            ui_logger.debug(f"Line {self._current_ocr_line.text} has matches.")
+            ui_logger.debug("Line %s has matches.", self._current_ocr_line.text)
             if self._current_ocr_line.ground_truth_exact_match:
-                self.GridVBox.layout = self.gray_editor_layout
+                editor_layout = self.gray_editor_layout
             else:
-                self.GridVBox.layout = self.red_editor_layout
+                editor_layout = self.red_editor_layout
 
         if (
             self._current_ocr_line.additional_block_attributes
@@ -137,13 +478,13 @@ class IpynbLineEditor:
             )
         ):
             ui_logger.debug(
-                f"Line {self._current_ocr_line.text} is marked as validated."
+                "Line %s is marked as validated.", self._current_ocr_line.text
             )
-            self.GridVBox.layout = self.green_editor_layout
-            ui_logger.debug(f"Line {self._current_ocr_line.text} green border added.")
+            editor_layout = self.green_editor_layout
+            ui_logger.debug("Line %s green border added.", self._current_ocr_line.text)
 
         ui_logger.debug(
-            f"Redrawing components for line: {self._current_ocr_line.text[:20]}..."
+            "Redrawing components for line: %s...", self._current_ocr_line.text[:20]
         )
 
         self.draw_ui_fullline_image_hbox()
@@ -151,18 +492,21 @@ class IpynbLineEditor:
         self.draw_ui_fullline_gt_text_hbox()
         self.draw_ui_line_actions_hbox()
         self.draw_ui_word_matching_table()
-        self.draw_ui_active_task()
 
-        self.rebuild_gridbox_children()
+        # Border and children go to the frontend as a single update
+        with self.GridVBox.hold_sync():
+            self.GridVBox.layout = editor_layout
+            self.rebuild_gridbox_children()
 
         ui_logger.debug("Line UI redrawn.")
+        return True
 
     def rebuild_gridbox_children(self):
         ui_logger.debug(
-            f"Rebuilding GridVBox children for line: {self._current_ocr_line.text[:20]}..."
+            "Rebuilding GridVBox children for line: %s...",
+            self._current_ocr_line.text[:20],
         )
         # Rebuild the GridVBox children
-        self.GridVBox.children = []
         self.GridVBox.children = [
             self.LineImageHBox,
             self.OcrLineTextHBox,
@@ -172,23 +516,31 @@ class IpynbLineEditor:
             self.TaskHBox,
         ]
         ui_logger.debug(
-            f"GridVBox children rebuilt for line: {self._current_ocr_line.text[:20]}."
+            "GridVBox children rebuilt for line: %s.", self._current_ocr_line.text[:20]
         )
 
     def draw_ui_fullline_image_hbox(self):
         ui_logger.debug("Drawing UI for full line image.")
-        self.LineImageHBox = HBox()
-        self.LineImageHBox.layout = self.basic_box_layout
         if self._current_ocr_line.bounding_box:
             if (
                 self._current_ocr_page.cv2_numpy_page_image is not None
                 and self._current_ocr_line.bounding_box
             ):
-                cropped_line_image_html = get_html_widget_from_cropped_image(
-                    self._current_ocr_page.cv2_numpy_page_image,
-                    self._current_ocr_line.bounding_box,
+                key = (
+                    id(self._current_ocr_page.cv2_numpy_page_image),
+                    tuple(self._current_ocr_line.bounding_box.to_ltrb()),
                 )
-                self.LineImageHBox.children = [cropped_line_image_html]
+                if self._line_image_cache is None or self._line_image_cache[0] != key:
+                    self._line_image_cache = (
+                        key,
+                        get_html_widget_from_cropped_image(
+                            self._current_ocr_page.cv2_numpy_page_image,
+                            self._current_ocr_line.bounding_box,
+                        ),
+                    )
+                self.LineImageHBox.children = [self._line_image_cache[1]]
+            else:
+                self.LineImageHBox.children = []
         else:
             ui_logger.warning("Line bounding box is not set. Cannot draw line image.")
             self.LineImageHBox.children = [
@@ -199,53 +551,89 @@ class IpynbLineEditor:
 
     def draw_ui_fullline_ocr_text_hbox(self):
         ui_logger.debug("Drawing UI for full line OCR text.")
-        self.OcrLineTextHBox = HBox()
-        self.OcrLineTextHBox.layout = self.basic_box_layout
         if self._current_ocr_line.ground_truth_exact_match:
             linecolor_css = "lightgray"
         else:
             linecolor_css = "unset"
 
-        self.OcrLineTextHBox.children = [
-            get_formatted_text_html_span(
-                linecolor_css=linecolor_css,
-                text=self._current_ocr_line.text,
-                font_family_css=self.monospace_font_name,
-                font_size_css="14px",
+        key = (self._current_ocr_line.text, linecolor_css)
+        if self._ocr_html_cache is None or self._ocr_html_cache[0] != key:
+            self._ocr_html_cache = (
+                key,
+                get_formatted_text_html_span(
+                    linecolor_css=linecolor_css,
+                    text=self._current_ocr_line.text,
+                    font_family_css=self.monospace_font_name,
+                    font_size_css="14px",
+                ),
             )
-        ]
+        self.OcrLineTextHBox.children = [self._ocr_html_cache[1]]
 
     def draw_ui_fullline_gt_text_hbox(self):
         ui_logger.debug("Drawing UI for full line GT text.")
-        self.GTLineTextHBox = HBox()
-        self.GTLineTextHBox.layout = self.basic_box_layout
         if self._current_ocr_line.ground_truth_exact_match:
             linecolor_css = "lightgray"
         else:
             linecolor_css = "unset"
 
-        self.GTLineTextHBox.children = [
-            get_formatted_text_html_span(
-                linecolor_css=linecolor_css,
-                text=(self._current_ocr_line.ground_truth_text or "&nbsp;"),
-                font_family_css=self.monospace_font_name,
-                font_size_css="14px",
+        gt_text = self._current_ocr_line.ground_truth_text or "&nbsp;"
+        key = (gt_text, linecolor_css)
+        if self._gt_html_cache is None or self._gt_html_cache[0] != key:
+            self._gt_html_cache = (
+                key,
+                get_formatted_text_html_span(
+                    linecolor_css=linecolor_css,
+                    text=gt_text,
+                    font_family_css=self.monospace_font_name,
+                    font_size_css="14px",
+                ),
             )
-        ]
+        self.GTLineTextHBox.children = [self._gt_html_cache[1]]
 
-    def draw_ui_line_actions_hbox(self):
-        ui_logger.debug("Drawing UI for line actions.")
-        CopyOCRToGTButton = Button(description="Copy Line to GT")
-        CopyOCRToGTButton.on_click(self.copy_ocr_to_gt)
+    def get_button(self, role, on_click: Callable, **kwargs) -> Button:
+        """Return this editor's Button for a role, bound to a new click handler.
+
+        The Button is created on first use; later redraws reuse it (and its
+        comm) instead of creating another one.
+        """
+        pooled = self._button_pool.get(role)
+        if pooled is None:
+            button = Button(**kwargs)
+        else:
+            button, previous_on_click = pooled
+            button.on_click(previous_on_click, remove=True)
+        button.on_click(on_click)
+        self._button_pool[role] = (button, on_click)
+        return button
+
+    def get_word_button(self, action: str, idx: int, **kwargs) -> Button:
+        """Return the Button for a word action at match `idx`.
 
-        DeleteLineButton = Button(description="Delete Line")
-        DeleteLineButton.on_click(self.delete_line)
+        Its handler looks the match up when clicked, so the Button is bound
+        once and kept as is by later redraws.
+        """
+        pooled = self._button_pool.get((action, idx))
+        if pooled is not None:
+            return pooled[0]
+        return self.get_button(
+            (action, idx), partial(self.on_word_button_click, action, idx), **kwargs
+        )
+
+    def on_word_button_click(self, action: str, idx: int, _button=None):
+        getattr(self, self.word_button_actions[action])(self.line_matches[idx])
 
-        MarkValidatedButton = Button(description="Mark as Validated")
-        MarkValidatedButton.on_click(self.mark_validated)
+    def draw_ui_line_actions_hbox(self):
+        ui_logger.debug("Drawing UI for line actions.")
+        CopyOCRToGTButton = self.get_button(
+            "copy_ocr_to_gt", self.copy_ocr_to_gt, description="Copy Line to GT"
+        )
+        DeleteLineButton = self.get_button(
+            "delete_line", self.delete_line, description="Delete Line"
+        )
+        MarkValidatedButton = self.get_button(
+            "mark_validated", self.mark_validated, description="Mark as Validated"
+        )
 
-        self.LineActionButtonsHBox = HBox()
-        self.LineActionButtonsHBox.layout = self.basic_box_layout
         self.LineActionButtonsHBox.children = [
             CopyOCRToGTButton,
             DeleteLineButton,
@@ -254,8 +642,6 @@ class IpynbLineEditor:
 
     def draw_ui_active_task(self):
         ui_logger.debug("Drawing UI for active task.")
-        self.TaskHBox = HBox()
-        self.TaskHBox.layout = self.basic_box_layout
         self.TaskHBox.children = []
 
         if self.task_type == EditorTaskType.SPLIT:
@@ -268,66 +654,59 @@ class IpynbLineEditor:
 
         return
 
-    def get_split_image_html_widget(self):
+    def get_split_image_html(self) -> str:
         ui_logger.debug("Getting split image.")
-        img_ndarray: ndarray = self.line_matches[self.task_match_idx]["img_ndarray"]
+        w = self.line_matches[self.task_match_idx]["img_ndarray"].shape[1]
 
-        h, w = img_ndarray.shape[:2]
+        # Mark the split with a red line over the (already encoded) word
+        # image, so moving it doesn't re-encode anything
+        left_pct = 100 * self.split_task_x_coordinate / w if w else 0
+        return (
+            '<div style="position: relative; display: inline-block;">'
+            f"{self._split_img_tag}"
+            '<div style="position: absolute; top: 0; '
+            f'left: {left_pct:.3f}%; width: 1px; height: 100%; background: red;">'
+            "</div></div>"
+        )
 
+    def init_split_positions(self):
+        """Start the split in the middle of the word image and the word text."""
+        match = self.line_matches[self.task_match_idx]
         if self.split_task_x_coordinate == -1:
             # Get the x coordinate of the split
-            self.split_task_x_coordinate = int(w / 2)
-
-        # use cv2 to draw a vertical red line on the image based on the split location
-        ui_logger.debug("Drawing Line on image.")
-        split_img = cv2_line(
-            img=img_ndarray.copy(),
-            pt1=(self.split_task_x_coordinate, 0),
-            pt2=(self.split_task_x_coordinate, h),
-            color=(255, 0, 0),
-            thickness=1,
-        )
-
-        # Encode the split image as PNG and get a <img> tag string
-        ui_logger.debug("Getting encoded image.")
-        _, _, data_src_string = get_encoded_image(split_img)
-
-        ui_logger.debug("Returning HTML widget.")
-        return HTML(
-            get_html_string_from_image_src(
-                data_src_string=data_src_string, height="height: 36px;"
-            )
-        )
+            self.split_task_x_coordinate = int(match["img_ndarray"].shape[1] / 2)
+        if self.split_task_word_split_idx == -1:
+            # half of the word length
+            self.split_task_word_split_idx = int(len(match["ocr_text"]) / 2)
 
+    @debounce(0.08)
     def update_split_image(self):
+        if self.task_type != EditorTaskType.SPLIT:
+            return
         ui_logger.debug("Updating split image.")
-        # Get the split image HTML widget
-        split_image_html = self.get_split_image_html_widget()
-
-        ui_logger.debug("Setting up HBox for split image.")
-        self.SplitImageHBox.children = [split_image_html]
+        self.SplitImageHTML.value = self.get_split_image_html()
 
         ui_logger.debug("Split image updated.")
         return
 
+    @debounce(0.08)
     def update_split_text(self):
+        if self.task_type != EditorTaskType.SPLIT:
+            return
         ui_logger.debug("Updating split ocr text.")
 
-        # Get the split text HTML widget
-        ocr_text: str = self.line_matches[self.task_match_idx]["ocr_text"]
-
-        if self.split_task_word_split_idx == -1:
-            # half of the word length
-            self.split_task_word_split_idx = int(len(ocr_text) / 2)
-
-        # insert | at the split location
-        ocr_text = (
-            ocr_text[: self.split_task_word_split_idx]
-            + "\u00a0"  # non-breaking space
-            + ocr_text[self.split_task_word_split_idx :]
-        )
-
-        ocr_text = "\u00a0".join(ocr_text) if ocr_text else ""
+        # The characters are spaced out with non-breaking spaces (character i
+        # is at index 2 * i); widen the gap at the split location
+        spaced = self._split_spaced_chars
+        split_idx = self.split_task_word_split_idx
+        left = spaced[: max(2 * split_idx - 1, 0)]
+        right = spaced[2 * split_idx :]
+        gap = "\u00a0"  # non-breaking space
+        if left:
+            gap = "\u00a0" + gap
+        if right:
+            gap += "\u00a0"
+        ocr_text = left + gap + right
 
         splitTextHTML = get_formatted_text_html_span(
             font_family_css=self.monospace_font_name,
@@ -384,11 +763,37 @@ class IpynbLineEditor:
 
     def draw_ui_split_task(self):
         ui_logger.debug("Drawing UI for split task.")
+        if self.SplitVBox is None:
+            self.build_ui_split_task()
 
-        self.SplitImageHBox = HBox()
-        self.SplitImageHBox.layout = Layout(margin="0px 0px 10px 0px")
+        # Don't show the previous word while the previews are rendered
+        self.SplitImageHTML.value = ""
+        self.SplitTextHBox.children = []
+        self.init_split_positions()
+
+        self._split_spaced_chars = "\u00a0".join(
+            self.line_matches[self.task_match_idx]["ocr_text"]
+        )
 
+        # Encode the word image once per task; the split marker is drawn over it
+        img_ndarray: ndarray = self.line_matches[self.task_match_idx]["img_ndarray"]
+        self._split_img_tag = get_html_string_from_image_src(
+            data_src_string=get_encoded_preview_image(img_ndarray),
+            height="height: 36px;",
+        )
         self.update_split_image()
+        self.update_split_text()
+
+        self.TaskHBox.children = [self.SplitVBox]
+
+        ui_logger.debug("Split task UI drawn.")
+        return
+
+    def build_ui_split_task(self):
+        """Create the split task widgets; they are reused by every split task."""
+        self.SplitImageHTML = HTML()
+        self.SplitImageHBox = HBox([self.SplitImageHTML])
+        self.SplitImageHBox.layout = Layout(margin="0px 0px 10px 0px")
 
         ui_logger.debug("Generating Buttons for split task.")
         self.CancelSplitButton = Button(
@@ -449,8 +854,6 @@ class IpynbLineEditor:
         self.SplitTextHBox = HBox()
         self.SplitTextHBox.layout = Layout(margin="0px 0px 10px 0px")
 
-        self.update_split_text()
-
         self.SplitWordArrowLeftButton = Button(
             description="<",
             layout=Layout(width="14px", margin="0px 2px 0px 2px", padding="1px"),
@@ -488,22 +891,16 @@ class IpynbLineEditor:
             self.SplitWordArrowRightButton,
         ]
 
-        self.SplitVBox: VBox = VBox(layout=Layout(margin="0px 0px 0px 10px"))
+        self.SplitVBox = VBox(layout=Layout(margin="0px 0px 0px 10px"))
         self.SplitVBox.children = [
             self.SplitVBoxLine1,
             self.SplitVBoxLine2,
         ]
 
-        self.TaskHBox.children = [self.SplitVBox]
-
-        ui_logger.debug("Split task UI drawn.")
-        return
-
     def get_edit_bbox(self):
         ui_logger.debug("Getting edit bbox image.")
         if self._current_ocr_page.cv2_numpy_page_image is None:
             raise ValueError("Current OCR page does not have a valid image.")
-        img_ndarray = self._current_ocr_page.cv2_numpy_page_image
 
         ui_logger.debug("Getting bounding box.")
         # Get the bounding box of the word
@@ -511,26 +908,22 @@ class IpynbLineEditor:
             "word"
         ].bounding_box
 
-        ui_logger.debug("Scaling bounding box.")
-        h, w = img_ndarray.shape[:2]
-        copy_bbox_scaled = word_bbox.scale(w, h)
-
-        ui_logger.debug(f"Scaled bounding box: {copy_bbox_scaled.to_ltrb()}")
-
-        # Adjust the bbox with the edit margins
-        ui_logger.debug("Adjusting Margins.")
-
-        minX = min(max(copy_bbox_scaled.minX + self.edit_margins[0], 0), w)
-        minY = min(max(copy_bbox_scaled.minY + self.edit_margins[1], 0), h)
-        maxX = min(max(copy_bbox_scaled.maxX + self.edit_margins[2], 0), w)
-        maxY = min(max(copy_bbox_scaled.maxY + self.edit_margins[3], 0), h)
-
-        edit_bbox_scaled = BoundingBox.from_ltrb(minX, minY, maxX, maxY)
+        # Scale the bbox to pixels and adjust it with the edit margins
+        ui_logger.debug("Scaling bounding box and adjusting margins.")
+        edit_bbox_scaled = self.apply_edit_margins(word_bbox)
 
         ui_logger.debug("Edit bounding box:")
         ui_logger.debug(f"{edit_bbox_scaled.to_ltrb()}")
         return edit_bbox_scaled
 
+    def apply_edit_margins(self, word_bbox: BoundingBox) -> BoundingBox:
+        """Scale a normalized bbox to pixels and add the edit margins, clamped to the page."""
+        page_ltrb = array([self._page_w, self._page_h, self._page_w, self._page_h])
+        ltrb = clip(
+            array(word_bbox.to_ltrb()) * page_ltrb + self.edit_margins, 0, page_ltrb
+        )
+        return BoundingBox.from_ltrb(*ltrb.tolist())
+
     def get_edit_bbox_image_html_widget(self):
         if self._current_ocr_page.cv2_numpy_page_image is None:
             raise ValueError("Current OCR page does not have a valid image.")
@@ -541,9 +934,13 @@ class IpynbLineEditor:
             f"Cropping image to bounding box {str(modified_bbox.to_ltrb())}."
         )
         # Crop the image to the bounding box
-        _, _, _, data_src_string = get_cropped_encoded_image_scaled_bbox(
-            img=img_ndarray, bounding_box_scaled=modified_bbox
-        )
+        cropped_img = img_ndarray[
+            int(modified_bbox.minY) : int(modified_bbox.maxY),
+            int(modified_bbox.minX) : int(modified_bbox.maxX),
+        ]
+        if cropped_img.size == 0:
+            return HTML("No Image")
+        data_src_string = get_encoded_preview_image(cropped_img)
 
         ui_logger.debug("Returning HTML widget.")
         return HTML(
@@ -552,7 +949,10 @@ class IpynbLineEditor:
             )
         )
 
+    @debounce(0.08)
     def update_edit_bbox_image(self):
+        if self.task_type != EditorTaskType.EDITBBOX:
+            return
         ui_logger.debug("Updating edit bbox image.")
         # Get the split image HTML widget
         edit_image_html = self.get_edit_bbox_image_html_widget()
@@ -566,12 +966,7 @@ class IpynbLineEditor:
     def edit_bbox_adjust_margin(self, margin: str, amount: int):
         ui_logger.debug(f"Adjusting edit bbox margin: {margin} by {amount}.")
 
-        self.edit_margins = [
-            self.edit_margins[0] + (amount if margin == "L" else 0),
-            self.edit_margins[1] + (amount if margin == "T" else 0),
-            self.edit_margins[2] + (amount if margin == "R" else 0),
-            self.edit_margins[3] + (amount if margin == "B" else 0),
-        ]
+        self.edit_margins["LTRB".index(margin)] += amount
 
         self.update_edit_bbox_image()
         return
@@ -580,7 +975,7 @@ class IpynbLineEditor:
         if self._current_ocr_page.cv2_numpy_page_image is None:
             raise ValueError("Current OCR page does not have a valid image.")
         img_ndarray: ndarray = self._current_ocr_page.cv2_numpy_page_image
-        h, w = img_ndarray.shape[:2]
+        h, w = self._page_h, self._page_w
 
         modified_bbox = self.get_edit_bbox()
 
@@ -589,8 +984,8 @@ class IpynbLineEditor:
         ui_logger.debug(f"Normalized Edit bbox: {normalized_modified_bbox.to_ltrb()}")
 
         ui_logger.debug("Refining bbox.")
-        normalized_refined_bbox: BoundingBox = normalized_modified_bbox.refine(
-            img_ndarray, padding_px=2
+        normalized_refined_bbox: BoundingBox = refine_cached(
+            img_ndarray, normalized_modified_bbox, padding_px=2
         )
         ui_logger.debug(
             f"Refined Edit bounding box: {normalized_refined_bbox.to_ltrb()}"
@@ -600,12 +995,9 @@ class IpynbLineEditor:
 
         ui_logger.debug(f"Edit Margins Before refinement: {self.edit_margins}")
 
-        self.edit_margins = [
-            self.edit_margins[0] + int(refined_bbox.minX - modified_bbox.minX),
-            self.edit_margins[1] + int(refined_bbox.minY - modified_bbox.minY),
-            self.edit_margins[2] + int(refined_bbox.maxX - modified_bbox.maxX),
-            self.edit_margins[3] + int(refined_bbox.maxY - modified_bbox.maxY),
-        ]
+        self.edit_margins += (
+            array(refined_bbox.to_ltrb()) - array(modified_bbox.to_ltrb())
+        ).astype(int32)
         ui_logger.debug(f"Edit Margins after refinement: {self.edit_margins}")
 
         self.update_edit_bbox_image()
@@ -618,7 +1010,7 @@ class IpynbLineEditor:
         if self._current_ocr_page.cv2_numpy_page_image is None:
             raise ValueError("Current OCR page does not have a valid image.")
         img_ndarray: ndarray = self._current_ocr_page.cv2_numpy_page_image
-        h, w = img_ndarray.shape[:2]
+        h, w = self._page_h, self._page_w
 
         modified_bbox = self.get_edit_bbox()
         ui_logger.debug("Normalizing bbox.")
@@ -646,12 +1038,9 @@ class IpynbLineEditor:
 
         ui_logger.debug(f"Edit Margins Before refinement: {self.edit_margins}")
 
-        self.edit_margins = [
-            self.edit_margins[0] + int(cropped_bbox.minX - modified_bbox.minX),
-            self.edit_margins[1] + int(cropped_bbox.minY - modified_bbox.minY),
-            self.edit_margins[2] + int(cropped_bbox.maxX - modified_bbox.maxX),
-            self.edit_margins[3] + int(cropped_bbox.maxY - modified_bbox.maxY),
-        ]
+        self.edit_margins += (
+            array(cropped_bbox.to_ltrb()) - array(modified_bbox.to_ltrb())
+        ).astype(int32)
         ui_logger.debug(f"Edit Margins after refinement: {self.edit_margins}")
 
         self.update_edit_bbox_image()
@@ -744,12 +1133,24 @@ class IpynbLineEditor:
         ]
 
     def draw_ui_edit_bbox_task(self):
-        self.EditBboxImageHBox = HBox()
-        self.EditBboxImageHBox.layout = Layout(margin="0px 0px 10px 0px")
+        if self.EditHBox is None:
+            self.build_ui_edit_bbox_task()
 
+        # Don't show the previous word while the preview is rendered
+        self.EditBboxImageHBox.children = []
         self.update_edit_bbox_image()
 
-        ui_logger.debug("Generating Buttons for split task.")
+        self.TaskHBox.children = [self.EditHBox]
+
+        ui_logger.debug("Edit BBox task UI drawn.")
+        return
+
+    def build_ui_edit_bbox_task(self):
+        """Create the edit bbox task widgets; they are reused by every edit task."""
+        self.EditBboxImageHBox = HBox()
+        self.EditBboxImageHBox.layout = Layout(margin="0px 0px 10px 0px")
+
+        ui_logger.debug("Generating Buttons for edit bbox task.")
         self.CancelEditBBoxButton = Button(
             description="X",
             layout=Layout(width="16px", margin="0px 2px 0px 2px", padding="1px"),
@@ -782,7 +1183,7 @@ class IpynbLineEditor:
 
         self.EditVBoxLine6 = HBox([self.EditVBoxSaveButton])
 
-        self.EditHBox: HBox = HBox()
+        self.EditHBox = HBox()
         self.EditVBox: VBox = VBox(layout=Layout(margin="0px 0px 0px 10px"))
 
         self.EditHBox.children = [self.EditVBox, self.EditBboxImageHBox]
@@ -796,45 +1197,30 @@ class IpynbLineEditor:
             self.EditVBoxLine6,
         ]
 
-        self.TaskHBox.children = [self.EditHBox]
-
-        ui_logger.debug("Edit BBox task UI drawn.")
-        return
-
     def start_split_task(self, match):
         ui_logger.debug("Starting split task.")
-        self.task_type = EditorTaskType.SPLIT
-        self.split_task_x_coordinate = -1
-        self.split_task_image_width = -1
-        self.task_match_idx = match["idx"]
-        self.redraw_ui()
+        self.task = EditorTaskState(EditorTaskType.SPLIT, match["idx"])
+        self.redraw_task_section()
         return
 
     def cancel_split_task(self):
         ui_logger.debug("Canceling split task.")
-        self.task_type = EditorTaskType.NONE
-        self.task_match_idx = -1
-        self.split_task_x_coordinate = -1
-        self.split_task_image_width = -1
-        self.redraw_ui()
+        self.task = EditorTaskState()
+        self.redraw_task_section()
         return
 
     def start_edit_bbox_task(self, match):
         ui_logger.debug("Starting edit bbox task.")
-        self.task_type = EditorTaskType.EDITBBOX
-        self.task_match_idx = match["idx"]
-        self.edit_margins = [0, 0, 0, 0]  # Left, Top, Right, Bottom
+        self.task = EditorTaskState(EditorTaskType.EDITBBOX, match["idx"])
 
-        self.redraw_ui()
+        self.redraw_task_section()
         return
 
     def cancel_edit_bbox_task(self):
         ui_logger.debug("Canceling edit bbox task.")
-        self.task_type = EditorTaskType.NONE
-        self.task_match_idx = -1
-        self.edit_margins = [0, 0, 0, 0]  # Reset margins
+        self.task = EditorTaskState()
 
-        self.redraw_ui()
+        self.redraw_task_section()
         return
 
     def execute_edit_bbox_task(self):
@@ -849,20 +1235,12 @@ class IpynbLineEditor:
         ui_logger.debug(
             f"Executing edit bbox task for match: {match['idx']} | word: {word.text}"
         )
-        # Get the bounding box of the word
-        word_bbox: BoundingBox = word.bounding_box
-        ui_logger.debug(f"Original bounding box: {word_bbox.to_ltrb()}")
+        ui_logger.debug(f"Original bounding box: {word.bounding_box.to_ltrb()}")
         # Adjust the bbox with the edit margins
-        h, w = self._current_ocr_page.cv2_numpy_page_image.shape[:2]
-        word_bbox = word_bbox.scale(w, h)
-        minX = min(max(word_bbox.minX + self.edit_margins[0], 0), w)
-        minY = min(max(word_bbox.minY + self.edit_margins[1], 0), h)
-        maxX = min(max(word_bbox.maxX + self.edit_margins[2], 0), w)
-        maxY = min(max(word_bbox.maxY + self.edit_margins[3], 0), h)
-        modified_bbox = BoundingBox.from_ltrb(minX, minY, maxX, maxY)
+        modified_bbox = self.get_edit_bbox()
         ui_logger.debug(f"Modified bounding box: {modified_bbox.to_ltrb()}")
         # normalize the bounding box
-        normalized_modified_bbox = modified_bbox.normalize(w, h)
+        normalized_modified_bbox = modified_bbox.normalize(self._page_w, self._page_h)
         # Set the bounding box of the word
         word.bounding_box = normalized_modified_bbox
         ui_logger.debug(
@@ -882,14 +1260,12 @@ class IpynbLineEditor:
         )
         ui_logger.debug("Word bounding boxes have been refined.")
 
-        self.task_type = EditorTaskType.NONE
-        self.task_match_idx = -1
-        self.edit_margins = [0, 0, 0, 0]  # Reset margins
+        self.task = EditorTaskState()
 
+        self._line_matches_dirty = True
         self.redraw_ui()
 
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
 
         ui_logger.debug("Edit bbox task executed.")
         return
@@ -911,7 +1287,7 @@ class IpynbLineEditor:
         # convert bbox width to pixels
         w = match["img_ndarray"].shape[1]
         ui_logger.debug(f"word image width: {w}")
-        full_w = self._current_ocr_page.cv2_numpy_page_image.shape[1]
+        full_w = self._page_w
         ui_logger.debug(f"full image width: {full_w}")
         ratio = float(w) / float(full_w)
         ui_logger.debug(f"w ratio: {ratio}")
@@ -932,8 +1308,8 @@ class IpynbLineEditor:
         # Expand the word bounding boxes if they were shrunk too much or didn't include all the connected pixels
         ui_logger.debug("Expanding word bounding boxes to content.")
         for word in self._current_ocr_line.items:
-            word.bounding_box = word.bounding_box.expand_to_content(
-                image=self._current_ocr_page.cv2_numpy_page_image,
+            word.bounding_box = expand_to_content_cached(
+                self._current_ocr_page.cv2_numpy_page_image, word.bounding_box
             )
 
         # Shrink the word bounding boxes to fit the text
@@ -964,28 +1340,40 @@ class IpynbLineEditor:
         # if self.line_change_callback:
         #     self.line_change_callback()
 
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
 
-        self.task_type = EditorTaskType.NONE
-        self.task_match_idx = -1
-        self.split_task_x_coordinate = -1
-        self.split_task_image_width = -1
+        self.task = EditorTaskState()
 
+        self._line_matches_dirty = True
         self.redraw_ui()
         ui_logger.debug("Split task executed.")
         return
 
-    def create_ui_word_match_widgets(self):
-        ui_logger.debug("Creating UI word match widgets...")
-        match_VBox = VBox()
-        match_VBox.layout = Layout(padding="0px", margin="0px", flex="0 0 auto")
+    def create_ui_word_match_widgets(self, idx: int) -> dict:
+        ui_logger.debug("Creating UI word match widgets for match: %s...", idx)
+        match_VBox = VBox(layout=self.word_match_vbox_layout)
+
+        image_HTML = HTML()
+        image_HBox = HBox([image_HTML], layout=self.basic_box_layout)
+        ocr_HBox = HBox(layout=self.basic_box_layout)
+
+        gt_TextBox = Text(
+            value="",
+            description="",
+            disabled=False,
+            continuous_update=False,
+            style=self.monospace_text_style,
+            layout=gt_text_layout(0),
+        )
+        # listen to changes in the text box
+        gt_TextBox.observe(
+            lambda change, idx=idx: self.on_gt_text_change(change, idx),
+            names="value",
+        )
+        gt_HBox = HBox([gt_TextBox])
 
-        image_HBox = HBox()
-        ocr_HBox = HBox()
-        gt_HBox = HBox()
-        action_buttons_HBox = HBox()
-        crop_buttons_HBox = HBox()
+        action_buttons_HBox = HBox(layout=self.word_buttons_layout)
+        crop_buttons_HBox = HBox(layout=self.word_buttons_layout)
 
         match_VBox.children = [
             image_HBox,
@@ -995,185 +1383,177 @@ class IpynbLineEditor:
             crop_buttons_HBox,
         ]
 
-        self.WordMatchingTableVBoxes.append(match_VBox)
+        widgets = {
+            "vbox": match_VBox,
+            "image_HTML": image_HTML,
+            "ocr_HBox": ocr_HBox,
+            "gt_TextBox": gt_TextBox,
+            "match": None,
+            "last_hash": None,
+        }
+        self._match_widget_cache[idx] = widgets
+        return widgets
 
     def load_word_match_image(self, match):
-        logger.debug(f"Loading word match image for match: {match['idx']}...")
-        image_HBox = self.WordMatchingTableVBoxes[match["idx"]].children[0]
-        if match["img_tag_text"]:
-            image_HBox.children = [
-                HTML(match["img_tag_text"]),
-            ]
-        else:
-            image_HBox.children = [
-                HTML("No Image"),
-            ]
-        image_HBox.layout = self.basic_box_layout
+        logger.debug("Loading word match image for match: %s...", match["idx"])
+        image_HTML = self._match_widget_cache[match["idx"]]["image_HTML"]
+        image_HTML.value = match["img_tag_text"] or "No Image"
 
     def load_word_match_text(self, match):
-        logger.debug(f"Loading word match text for match: {match['idx']}...")
+        logger.debug("Loading word match text for match: %s...", match["idx"])
         # Set the word match text
-        ocr_HBox = self.WordMatchingTableVBoxes[match["idx"]].children[1]
-        gt_HBox = self.WordMatchingTableVBoxes[match["idx"]].children[2]
-
-        if match["ocr_text"]:
-            ocr_HBox.children = [
-                get_formatted_text_html_span(
-                    linecolor_css=match["ocr_text_color"],
-                    text=match["ocr_text"],
-                    font_family_css=self.monospace_font_name,
-                )
-            ]
-        else:
-            ocr_HBox.children = [
-                get_formatted_text_html_span(
-                    linecolor_css=match["ocr_text_color"],
-                    text="No OCR",
-                    font_family_css=self.monospace_font_name,
-                )
-            ]
-        ocr_HBox.layout = self.basic_box_layout
+        widgets = self._match_widget_cache[match["idx"]]
 
-        gt_width = max(len(match["gt_text"]) * 9 + 16, 100)
-
-        gt_TextBox = Text(
-            value=match["gt_text"],
-            description="",
-            disabled=False,
-            continuous_update=False,
-            style={"font-family": self.monospace_font_name},
-            layout=Layout(
-                width=f"{gt_width}px",
-                padding="0px",
-                margin="0px",
-            ),
-        )
-        gt_HBox.children = [
-            gt_TextBox,
+        widgets["ocr_HBox"].children = [
+            word_text_span(
+                linecolor_css=match["ocr_text_color"],
+                text=match["ocr_text"] or "No OCR",
+                font_family_css=self.monospace_font_name,
+            )
         ]
-        # listen to changes in the text box
-        gt_TextBox.observe(
-            lambda change, match=match: self.update_gt_text(change, match),
-            names="value",
-        )
+
+        gt_TextBox = widgets["gt_TextBox"]
+        gt_TextBox.layout = gt_text_layout(len(match["gt_text"]))
+        self._suppress_gt_observer = True
+        try:
+            gt_TextBox.value = match["gt_text"]
+        finally:
+            self._suppress_gt_observer = False
 
     def load_word_crop_buttons(self, match):
         """Load crop buttons for individual word bounding box modifications"""
-        logger.debug(f"Loading word crop buttons for match: {match['idx']}...")
+        logger.debug("Loading word crop buttons for match: %s...", match["idx"])
         crop_buttons_HBox = self.WordMatchingTableVBoxes[match["idx"]].children[4]
         crop_buttons_HBox_children = []
 
-        if self.task_type != EditorTaskType.NONE:
-            ui_logger.debug(
-                f"Task is active: {self.task_type.name}. No crop buttons will be displayed."
-            )
-            # If an editor task is active, don't display crop buttons
-            crop_buttons_HBox.children = []
-            return
-
         word = match["word"]
         if word:
             # Add crop buttons for quick bounding box modifications
-            crop_top_button = Button(
+            crop_top_button = self.get_word_button(
+                "crop_top",
+                match["idx"],
                 description="CT",
-                layout=Layout(width="22px", padding="0px", margin="0px 1px"),
+                layout=self.word_crop_button_layout,
                 tooltip="Crop Top",
             )
-            crop_top_button.on_click(lambda _, m=match: self.crop_word_top(m))
             crop_buttons_HBox_children.append(crop_top_button)
 
-            crop_bottom_button = Button(
+            crop_bottom_button = self.get_word_button(
+                "crop_bottom",
+                match["idx"],
                 description="CB",
-                layout=Layout(width="22px", padding="0px", margin="0px 1px"),
+                layout=self.word_crop_button_layout,
                 tooltip="Crop Bottom",
             )
-            crop_bottom_button.on_click(lambda _, m=match: self.crop_word_bottom(m))
             crop_buttons_HBox_children.append(crop_bottom_button)
 
-            crop_both_button = Button(
+            crop_both_button = self.get_word_button(
+                "crop_both",
+                match["idx"],
                 description="CA",
-                layout=Layout(width="22px", padding="0px", margin="0px 1px"),
+                layout=self.word_crop_button_layout,
                 tooltip="Crop All (Top and Bottom)",
             )
-            crop_both_button.on_click(lambda _, m=match: self.crop_word_both(m))
             crop_buttons_HBox_children.append(crop_both_button)
 
         crop_buttons_HBox.children = crop_buttons_HBox_children
-        crop_buttons_HBox.layout = Layout(flex_wrap="wrap")
 
-    def load_word_action_buttons(self, match):
-        logger.debug(f"Loading word action buttons for match: {match['idx']}...")
+    def load_word_action_buttons(self, match, word_count: int):
+        logger.debug("Loading word action buttons for match: %s...", match["idx"])
         action_buttons_HBox = self.WordMatchingTableVBoxes[match["idx"]].children[3]
         action_buttons_HBox_children = []
 
-        if self.task_type != EditorTaskType.NONE:
-            ui_logger.debug(
-                f"Task is active: {self.task_type.name}. No Buttons will be displayed."
-            )
-            # If an editor task is active, don't display action buttons
-            return
-
-        delete_button = Button(
+        idx = match["idx"]
+        delete_button = self.get_word_button(
+            "delete",
+            idx,
             description="X",
-            layout=Layout(width="16px", padding="0px", margin="0px"),
+            layout=self.word_delete_button_layout,
         )
-        delete_button.on_click(lambda _: self.delete_match(match))
         action_buttons_HBox_children.append(delete_button)
 
         word = match["word"]
         if word:
             if match["word_idx"] > 0:
-                ml_button = Button(
+                ml_button = self.get_word_button(
+                    "merge_left",
+                    idx,
                     description="ML",
-                    layout=Layout(width="22px", padding="0px", margin="0px"),
+                    layout=self.word_action_button_layout,
                 )
-                ml_button.on_click(lambda _: self.merge_left(match))
                 action_buttons_HBox_children.append(ml_button)
 
-            if match["word_idx"] < len(self._current_ocr_line.items) - 1:
-                mr_button = Button(
+            if match["word_idx"] < word_count - 1:
+                mr_button = self.get_word_button(
+                    "merge_right",
+                    idx,
                     description="MR",
-                    layout=Layout(width="22px", padding="0px", margin="0px"),
+                    layout=self.word_action_button_layout,
                 )
-                mr_button.on_click(lambda _: self.merge_right(match))
                 action_buttons_HBox_children.append(mr_button)
 
-            edit_bbox_button = Button(
+            edit_bbox_button = self.get_word_button(
+                "edit_bbox",
+                idx,
                 description="EB",
-                layout=Layout(width="22px", padding="0px", margin="0px"),
+                layout=self.word_action_button_layout,
             )
-            edit_bbox_button.on_click(lambda _: self.start_edit_bbox_task(match))
             action_buttons_HBox_children.append(edit_bbox_button)
 
-            split_button = Button(
+            split_button = self.get_word_button(
+                "split",
+                idx,
                 description="SP",
-                layout=Layout(width="22px", padding="0px", margin="0px"),
+                layout=self.word_action_button_layout,
             )
-            split_button.on_click(lambda _: self.start_split_task(match))
             action_buttons_HBox_children.append(split_button)
 
         action_buttons_HBox.children = action_buttons_HBox_children
-        action_buttons_HBox.layout = Layout(flex_wrap="wrap")
 
-    def load_word_match_widgets(self, match):
-        self.load_word_match_image(match)
-        self.load_word_match_text(match)
-        self.load_word_action_buttons(match)
+    def show_word_buttons(self, visible: bool):
+        """Show the per-word action/crop buttons; they are hidden while a task is active."""
+        layout = self.word_buttons_layout if visible else self.word_buttons_hidden_layout
+        for match_VBox in self.WordMatchingTableVBoxes:
+            match_VBox.children[3].layout = layout
+            match_VBox.children[4].layout = layout
+
+    @staticmethod
+    def match_content_hash(match) -> int:
+        return hash(
+            (
+                match["ocr_text"],
+                match["gt_text"],
+                match["ocr_text_color"],
+                match["img_tag_text"],
+            )
+        )
+
+    def load_word_match_widgets(self, match, word_count: int):
+        widgets = self._match_widget_cache[match["idx"]]
+        content_hash = self.match_content_hash(match)
+        # Image and texts only change with the match's content; the buttons
+        # are rebound every time since they act on the current match
+        if content_hash != widgets["last_hash"]:
+            self.load_word_match_image(match)
+            self.load_word_match_text(match)
+            widgets["last_hash"] = content_hash
+        self.load_word_action_buttons(match, word_count)
         self.load_word_crop_buttons(match)
 
     def draw_ui_word_matching_table(self):
         ui_logger.debug("Drawing UI for word matching table.")
-        self.WordMatchingTableHBox = HBox()
         self.WordMatchingTableVBoxes = []
+        word_count = len(self._current_ocr_line.items)
 
         for match in self.line_matches:
-            self.create_ui_word_match_widgets()
-            self.load_word_match_widgets(match)
+            widgets = self._match_widget_cache.get(
+                match["idx"]
+            ) or self.create_ui_word_match_widgets(match["idx"])
+            widgets["match"] = match
+            self.WordMatchingTableVBoxes.append(widgets["vbox"])
+            self.load_word_match_widgets(match, word_count)
 
-        self.WordMatchingTableHBox.children = [
-            match_vbox for match_vbox in self.WordMatchingTableVBoxes
-        ]
-        self.WordMatchingTableHBox.layout
+        self.WordMatchingTableHBox.children = self.WordMatchingTableVBoxes
 
     ####################################################################
     # ACTIONS
@@ -1213,8 +1593,7 @@ class IpynbLineEditor:
         )
 
         logger.debug("Calling line_change_callback")
-        if self.line_change_callback:
-            self.line_change_callback()
+        self.schedule_callback("line_change_callback")
 
         logger.debug("Redrawing UI")
         self.redraw_ui()
@@ -1226,28 +1605,68 @@ class IpynbLineEditor:
             self._current_ocr_line.remove_item(word)
             self._current_ocr_page.remove_empty_items()
         else:
-            if self._current_ocr_line.unmatched_ground_truth_words:
-                self._current_ocr_line.unmatched_ground_truth_words = [
-                    unmatched_gt_word
-                    for unmatched_gt_word in self._current_ocr_line.unmatched_ground_truth_words
-                    if unmatched_gt_word[0] != match["word_idx"]
-                    and unmatched_gt_word[1] != match["gt_text"]
-                ]
+            self._remove_unmatched_gt_word(match)
+        self._line_matches_dirty = True
         self.redraw_ui()
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
+
+    def _unmatched_gt_word_position(self, match) -> int | None:
+        """Position in the line's unmatched_ground_truth_words of an unmatched match."""
+        if match["word"]:
+            return None
+        # Unmatched matches sit one after the word index they were recorded with
+        key = (match["word_idx"] - 1, match["gt_text"])
+        for position, unmatched_gt_word in enumerate(
+            self._current_ocr_line.unmatched_ground_truth_words or ()
+        ):
+            if tuple(unmatched_gt_word) == key:
+                return position
+        return None
+
+    def _remove_unmatched_gt_word(self, match):
+        position = self._unmatched_gt_word_position(match)
+        if position is not None:
+            del self._current_ocr_line.unmatched_ground_truth_words[position]
+
+    def on_gt_text_change(self, change, idx: int):
+        self.update_gt_text(change, self._match_widget_cache[idx]["match"])
 
     def update_gt_text(self, change, match):
+        # Programmatic writes during a redraw aren't edits
+        if self._suppress_gt_observer:
+            return
         # Update the ground truth text in the word
         word: Word = match["word"]
         if word:
             word.ground_truth_text = change["new"]
+            self._pending_gt_words[id(word)] = word
+            # Marked now; the page may change before the debounced rescore runs
+            if self.page_edited_callback:
+                self.page_edited_callback()
+            self.rescore_gt_words()
+
+    @debounce(0.15)
+    def rescore_gt_words(self):
+        self._rescore_pending_gt_words()
+
+    def _rescore_pending_gt_words(self):
+        """Score the words edited since the last call, then redraw once for all of them."""
+        words = list(self._pending_gt_words.values())
+        self._pending_gt_words.clear()
+        if not words:
+            return
+        for word in words:
             word.ground_truth_match_keys["match_score"] = word.fuzz_score_against(
                 word.ground_truth_text
             )
-            self.redraw_ui()
-            if self.page_image_change_callback:
-                self.page_image_change_callback()
+        self._line_matches_dirty = True
+        self.redraw_ui()
+        self.schedule_callback("page_image_change_callback")
+
+    def flush_pending_edits(self):
+        """Apply a pending GT rescore and its callbacks now, before the page changes."""
+        self._rescore_pending_gt_words()
+        self.flush_callbacks()
 
     def copy_ocr_to_gt(self, event=None):
         # Copy all of the the OCR text into the GT text for each OCR word
@@ -1258,19 +1677,20 @@ class IpynbLineEditor:
                 word.ground_truth_text
             )
         # Redraw the UI after update
+        self._line_matches_dirty = True
         self.redraw_ui()
+        self.schedule_callback("line_change_callback")
 
     def delete_line(self, event=None):
         # Delete the line from the OCR page
         self._current_ocr_page.remove_line_if_exists(self._current_ocr_line)
         self._current_ocr_page.remove_empty_items()
         self.GridVBox.children = []
-        self.GridVBox.layout = Layout(display="none")
+        self.GridVBox.layout = self.hidden_editor_layout
         #        if self.line_change_callback:
         #            self.line_change_callback()
 
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
 
     def merge_left(self, match):
         prev_match_idx = self.line_matches.index(match) - 1
@@ -1286,9 +1706,9 @@ class IpynbLineEditor:
             prev_word.merge(word)
             self.line_matches.remove(match)
             self._current_ocr_line.remove_item(word)
+            self._line_matches_dirty = True
             self.redraw_ui()
-            if self.page_image_change_callback:
-                self.page_image_change_callback()
+            self.schedule_callback("page_image_change_callback")
 
         elif not match["word"] and prev_match["word"]:
             logger.debug(
@@ -1301,26 +1721,28 @@ class IpynbLineEditor:
                 prev_word.fuzz_score_against(prev_word.ground_truth_text)
             )
             self.line_matches.remove(match)
-            if self._current_ocr_line.unmatched_ground_truth_words:
-                self._current_ocr_line.unmatched_ground_truth_words.remove(
-                    (match["word_idx"], gt_text)
-                )
+            self._remove_unmatched_gt_word(match)
         else:
             # merge unmatched ground truth together
             logger.debug(
                 "Current and previos words are not OCR words, merging current ground truth into previous ground truth"
             )
             gt_text = match["gt_text"]
+            # The line's entry is what the next redraw shows, so update it too
+            prev_position = self._unmatched_gt_word_position(prev_match)
             prev_match["gt_text"] = f"{prev_match['gt_text']}{gt_text}"
-            self.line_matches.remove(match)
-            if self._current_ocr_line.unmatched_ground_truth_words:
-                self._current_ocr_line.unmatched_ground_truth_words.remove(
-                    (match["word_idx"], gt_text)
+            if prev_position is not None:
+                unmatched_words = self._current_ocr_line.unmatched_ground_truth_words
+                prev_entry = unmatched_words[prev_position]
+                unmatched_words[prev_position] = type(prev_entry)(
+                    (prev_entry[0], prev_match["gt_text"])
                 )
+            self.line_matches.remove(match)
+            self._remove_unmatched_gt_word(match)
 
+        self._line_matches_dirty = True
         self.redraw_ui()
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
 
     def merge_right(self, match):
         word: Word = match["word"]
@@ -1330,11 +1752,10 @@ class IpynbLineEditor:
             next_word: Word = self._current_ocr_line.items[word_idx + 1]
             word.merge(next_word)
             self._current_ocr_line.remove_item(next_word)
+            self._line_matches_dirty = True
             self.redraw_ui()
-            if self.line_change_callback:
-                self.line_change_callback()
-            if self.page_image_change_callback:
-                self.page_image_change_callback()
+            self.schedule_callback("line_change_callback")
+            self.schedule_callback("page_image_change_callback")
 
     def calculate_line_matches(self):
         if self._current_ocr_page.cv2_numpy_page_image is None:
@@ -1343,34 +1764,46 @@ class IpynbLineEditor:
         matches = []
 
         logger.debug(
-            f"Calculating match components for line: {self._current_ocr_line.text[0:20]}..."
-        )
+            "Calculating match components for line: %s...",
+            self._current_ocr_line.text[0:20],
+        )
+
+        # With an event loop running the table is drawn before the thumbnails
+        # are encoded; they are filled in by on_word_crop_encoded
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        crops, pending = word_crops_cached(
+            self._current_ocr_page.cv2_numpy_page_image,
+            self._current_ocr_line.items,
+            wait=loop is None,
+        )
+        for key, future in pending.items():
+            future.add_done_callback(
+                lambda future, key=key: loop.call_soon_threadsafe(
+                    self.on_word_crop_encoded, key, future
+                )
+            )
 
         word: Word
-        for word_idx, word in enumerate(self._current_ocr_line.items):
+        for word_idx, (word, (data_src_string, img_tag_text)) in enumerate(
+            zip(self._current_ocr_line.items, crops)
+        ):
             gt_text = word.ground_truth_text or ""
             ocr_text = word.text or ""
-            logger.debug(f"Word: {ocr_text} | {gt_text}")
+            logger.debug("Word: %s | %s", ocr_text, gt_text)
 
-            img_ndarray, _, _, data_src_string = get_cropped_word_image(
-                img=self._current_ocr_page.cv2_numpy_page_image,
-                word=word,
-            )
-
-            # Encode the cropped image as PNG and get a <img> tag string
-            img_tag_text = get_html_string_from_image_src(
-                data_src_string=data_src_string, height="height: 14px;"
-            )
+            # Keep a view of the word's pixels rather than holding on to the crop
+            img_ndarray = self.word_image_view(word.bounding_box)
 
-            ocr_text_color = "lightgray"
-            gt_text_color = "lightgray"
-            if "match_score" not in word.ground_truth_match_keys or (
-                word.ground_truth_match_keys["match_score"] == 0 and gt_text == ""
-            ):
-                ocr_text_color = "red"
-            elif word.ground_truth_match_keys["match_score"] != 100:
-                ocr_text_color = "blue"
-                gt_text_color = "blue"
+            score = word.ground_truth_match_keys.get("match_score")
+            if score is None or (score == 0 and not gt_text):
+                ocr_text_color, gt_text_color = UNMATCHED_WORD_COLORS
+            elif score != 100:
+                ocr_text_color, gt_text_color = MISMATCHED_WORD_COLORS
+            else:
+                ocr_text_color, gt_text_color = MATCHED_WORD_COLORS
 
             match = {
                 "word_idx": word_idx,
@@ -1388,30 +1821,25 @@ class IpynbLineEditor:
 
         logger.debug("Adding unmatched ground truth words to matches...")
 
-        # Insert "unmatched" ground truth words
-        if self._current_ocr_line.unmatched_ground_truth_words:
-            # Insert unmatched ground truth words in reverse order
-            # to avoid messing up the indices of the already inserted words
-            # (since we are inserting into the same list)
-            for unmatched_words in reversed(
-                self._current_ocr_line.unmatched_ground_truth_words
+        # Merge in the "unmatched" ground truth words; each one follows the
+        # OCR word at its recorded index (-1 puts it before the first word)
+        unmatched_words = sorted(
+            self._current_ocr_line.unmatched_ground_truth_words or (),
+            key=lambda unmatched_gt_word: unmatched_gt_word[0],
+        )
+        merged = []
+        position = 0
+        for word_match in matches:
+            while (
+                position < len(unmatched_words)
+                and unmatched_words[position][0] < word_match["word_idx"]
             ):
-                unmatched_gt_word_idx = unmatched_words[0]
-                unmatched_gt_word = unmatched_words[1]
-
-                match = {
-                    "word_idx": unmatched_gt_word_idx + 1,
-                    "word": None,
-                    "img_ndarray": None,
-                    "data_src_string": None,
-                    "img_tag_text": None,
-                    "ocr_text": "",
-                    "gt_text": unmatched_gt_word,
-                    "ocr_text_color": "red",
-                    "gt_text_color": "red",
-                }
-
-                matches.insert(unmatched_gt_word_idx + 1, match)
+                merged.append(self.unmatched_gt_word_match(*unmatched_words[position]))
+                position += 1
+            merged.append(word_match)
+        for unmatched_gt_word in unmatched_words[position:]:
+            merged.append(self.unmatched_gt_word_match(*unmatched_gt_word))
+        matches = merged
 
         logger.debug("Adding Indexer")
 
@@ -1421,7 +1849,49 @@ class IpynbLineEditor:
 
         self.line_matches = matches
 
-        logger.debug(f"Line matching complete: {self._current_ocr_line.text[0:20]}...")
+        logger.debug("Line matching complete: %s...", self._current_ocr_line.text[0:20])
+
+    @staticmethod
+    def unmatched_gt_word_match(unmatched_gt_word_idx: int, unmatched_gt_word: str):
+        return {
+            "word_idx": unmatched_gt_word_idx + 1,
+            "word": None,
+            "img_ndarray": None,
+            "data_src_string": None,
+            "img_tag_text": None,
+            "ocr_text": "",
+            "gt_text": unmatched_gt_word,
+            "ocr_text_color": "red",
+            "gt_text_color": "red",
+        }
+
+    def on_word_crop_encoded(self, key: tuple, future: Future):
+        """Show a thumbnail that finished encoding after its table was drawn."""
+        if future.exception() is not None:
+            logger.error(f"Failed to encode word image: {future.exception()}")
+            return
+        data_src_string, img_tag_text = future.result()
+        for match in self.line_matches:
+            if (
+                match["word"] is None
+                or match["img_tag_text"] is not None
+                or tuple(match["word"].bounding_box.to_ltrb()) != key
+            ):
+                continue
+            match["data_src_string"] = data_src_string
+            match["img_tag_text"] = img_tag_text
+            widgets = self._match_widget_cache.get(match["idx"])
+            if widgets is not None and widgets["match"] is match:
+                self.load_word_match_image(match)
+                widgets["last_hash"] = self.match_content_hash(match)
+
+    def word_image_view(self, bounding_box: BoundingBox) -> ndarray:
+        """The pixels of a normalized bbox as a view into the page image (no copy)."""
+        left, top, right, bottom = bounding_box.to_ltrb()
+        return self._current_ocr_page.cv2_numpy_page_image[
+            int(top * self._page_h) : int(bottom * self._page_h),
+            int(left * self._page_w) : int(right * self._page_w),
+        ]
 
     def crop_word_top(self, match):
         """Crop the top of a word's bounding box"""
@@ -1442,11 +1912,11 @@ class IpynbLineEditor:
         self._current_ocr_page.recompute_bounding_box()
 
         # Refresh the display
+        self._line_matches_dirty = True
         self.redraw_ui()
 
         # Trigger callbacks
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
         # if self.line_change_callback:
         #     self.line_change_callback()
 
@@ -1468,11 +1938,11 @@ class IpynbLineEditor:
         self._current_ocr_page.recompute_bounding_box()
 
         # Refresh the display
+        self._line_matches_dirty = True
         self.redraw_ui()
 
         # Trigger callbacks
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
         # if self.line_change_callback:
         #     self.line_change_callback()
 
@@ -1498,10 +1968,10 @@ class IpynbLineEditor:
         self._current_ocr_page.recompute_bounding_box()
 
         # Refresh the display
+        self._line_matches_dirty = True
         self.redraw_ui()
 
         # Trigger callbacks
-        if self.page_image_change_callback:
-            self.page_image_change_callback()
+        self.schedule_callback("page_image_change_callback")
         # if self.line_change_callback:
         #     self.line_change_callback()
@@ -1,9 +1,10 @@
+from collections import OrderedDict
 from enum import Enum
-from logging import DEBUG as logging_DEBUG
+from html import escape
 from logging import getLogger
 from typing import Callable, Optional
 
-from ipywidgets import Layout, RadioButtons, VBox, Button
+from ipywidgets import HTML, HBox, Layout, RadioButtons, VBox, Button
 
 from pd_book_tools.ocr.page import Page
 from pd_book_tools.pgdp.pgdp_results import PGDPPage
@@ -32,8 +33,17 @@ class IpynbPageEditor:
     line_matching_configuration: LineMatching = LineMatching.SHOW_ALL_LINES
 
     page_image_change_callback: Optional[Callable] = None
-
-    line_editors: list[IpynbLineEditor]
+    # Called on line edits that don't redraw the page images
+    page_edited_callback: Optional[Callable] = None
+
+    # Line editors are built on demand; None until a line is opened
+    line_editors: list[IpynbLineEditor | None]
+    # Lines with a built editor, least recently opened first
+    _realized_lines: OrderedDict
+    # Collapsed stand-ins for lines without an editor, by line index
+    _line_placeholders: dict[int, VBox]
+    # How many line editors are kept built; older ones fold back into placeholders
+    max_realized_line_editors: int = 20
 
     def _observe_show_exact_line_matches(self, change=None):
         ui_logger.debug(f"Radio Button Changed: {str(change)}")
@@ -136,6 +146,7 @@ class IpynbPageEditor:
         current_ocr_page: Page | None,
         monospace_font_name: str = "Courier New",
         page_image_change_callback: Optional[Callable] = None,
+        page_edited_callback: Optional[Callable] = None,
     ):
         self.line_matching_configuration = LineMatching.SHOW_ALL_LINES
         # self.show_exact_line_matches = False
@@ -144,6 +155,7 @@ class IpynbPageEditor:
         self.monospace_font_name = monospace_font_name
         self.init_ui()
         self.page_image_change_callback = page_image_change_callback
+        self.page_edited_callback = page_edited_callback
 
         def line_change_callback():
             """
@@ -151,6 +163,8 @@ class IpynbPageEditor:
             This function is called when a line is changed in the line editor.
             """
             logger.debug("Line change callback triggered")
+            if self.page_edited_callback:
+                self.page_edited_callback()
             # If the line has been marked as validated, we need to update the line in the current OCR page
             self.rebuild_visible_lines()
 
@@ -160,43 +174,92 @@ class IpynbPageEditor:
         logger.debug("Regenerating line editors")
 
         self.line_editors = []
+        self._realized_lines = OrderedDict()
+        self._line_placeholders = {}
         if self._current_ocr_page and self._current_pgdp_page:
-            for line in self._current_ocr_page.lines:
-                logger.debug("Creating line editor for line: " + str(line.text[:20]))
-                line_editor = IpynbLineEditor(
-                    page=self._current_ocr_page,
-                    pgdp_page=self._current_pgdp_page,
-                    line=line,
-                    page_image_change_callback=self.page_image_change_callback,
-                    line_change_callback=self.line_change_callback,
-                    monospace_font_name=self.monospace_font_name,
-                )
-                self.line_editors.append(line_editor)
+            self.line_editors = [None] * len(self._current_ocr_page.lines)
 
-        if logger.level == logging_DEBUG:
-            logger.debug(lambda s: "Line editor count: " + str(len(self.line_editors)))
+        logger.debug("Line editor count: %s", len(self.line_editors))
 
         logger.debug("done regenerating line editors")
 
+    def realize_line_editor(self, idx: int) -> IpynbLineEditor:
+        """Build the editor of line `idx`, folding the least recently opened one if over the limit."""
+        line_editor = self.line_editors[idx]
+        if line_editor is not None:
+            self._realized_lines.move_to_end(idx)
+            return line_editor
+
+        line = self._current_ocr_page.lines[idx]
+        logger.debug("Creating line editor for line: %s", line.text[:20])
+        line_editor = IpynbLineEditor(
+            page=self._current_ocr_page,
+            pgdp_page=self._current_pgdp_page,
+            line=line,
+            page_image_change_callback=self.page_image_change_callback,
+            line_change_callback=self.line_change_callback,
+            monospace_font_name=self.monospace_font_name,
+            page_edited_callback=self.page_edited_callback,
+        )
+        self.line_editors[idx] = line_editor
+        self._realized_lines[idx] = None
+        # The line can be edited while open; fold it back with a fresh summary
+        self._line_placeholders.pop(idx, None)
+
+        while len(self._realized_lines) > self.max_realized_line_editors:
+            evicted_idx, _ = self._realized_lines.popitem(last=False)
+            logger.debug("Folding line editor %s", evicted_idx)
+            self.line_editors[evicted_idx].GridVBox.children = []
+            self.line_editors[evicted_idx] = None
+        return line_editor
+
+    def flush_pending_edits(self):
+        """Apply the open line editors' debounced edits to the current page."""
+        for line_editor in self.line_editors:
+            if line_editor is not None:
+                line_editor.flush_pending_edits()
+
+    def open_line_editor(self, idx: int):
+        self.realize_line_editor(idx)
+        self.rebuild_visible_lines()
+
+    def get_line_placeholder(self, idx: int) -> VBox:
+        """A one-line summary of line `idx` with a button that opens its editor."""
+        line = self._current_ocr_page.lines[idx]
+        if (
+            line.additional_block_attributes
+            and line.additional_block_attributes.get("line_editor_validated")
+        ):
+            layout = IpynbLineEditor.green_editor_layout
+        elif line.ground_truth_exact_match:
+            layout = IpynbLineEditor.gray_editor_layout
+        else:
+            layout = IpynbLineEditor.red_editor_layout
+
+        placeholder = self._line_placeholders.get(idx)
+        if placeholder is None:
+            edit_button = Button(
+                description="Edit",
+                layout=IpynbLineEditor.word_action_button_layout,
+            )
+            edit_button.on_click(lambda _, idx=idx: self.open_line_editor(idx))
+            summary = HTML(
+                f"<span style='font-family: {self.monospace_font_name};'>"
+                f"{escape(line.text or '')}</span>"
+            )
+            placeholder = VBox([HBox([edit_button, summary])])
+            self._line_placeholders[idx] = placeholder
+        placeholder.layout = layout
+        return placeholder
+
     def update_line_matches(self, current_pgdp_page: PGDPPage, current_ocr_page: Page):
         self._current_pgdp_page = current_pgdp_page
         self._current_ocr_page = current_ocr_page
         self.rebuild_content_ui()
 
-    def rebuild_visible_lines(self):
-        """
-        Rebuild the visible lines in the UI.
-        This function is called when the line matching configuration changes.
-        """
-        # Clear the current content
-        logger.debug("Rebuilding visible lines")
-
-        if self._current_ocr_page is None:
-            return
-
-        logger.debug("Line count: " + str(len(self._current_ocr_page.lines)))
-
-        boxes = []
+    def visible_line_indexes(self) -> list[int]:
+        """Indexes of the lines shown under the current line matching configuration."""
+        visible = []
         for idx, line in enumerate(self._current_ocr_page.lines):
             if line.ground_truth_exact_match and (
                 self.line_matching_configuration == LineMatching.SHOW_ONLY_MISMATCHES
@@ -204,7 +267,9 @@ class IpynbPageEditor:
                 == LineMatching.SHOW_ONLY_UNVALIDATED_MISMATCHES
             ):
                 logger.debug(
-                    f"Skipping line {idx} because it is an exact match: {line.ground_truth_exact_match}"
+                    "Skipping line %s because it is an exact match: %s",
+                    idx,
+                    line.ground_truth_exact_match,
                 )
                 # Skip exact matches
                 continue
@@ -216,14 +281,37 @@ class IpynbPageEditor:
                 == LineMatching.SHOW_ONLY_UNVALIDATED_MISMATCHES
                 and line.additional_block_attributes.get("line_editor_validated", False)
             ):
-                logger.debug(
-                    f"Skipping line {idx} because it is validated: {line.additional_block_attributes.get('line_editor_validated', False)}"
-                )
+                logger.debug("Skipping line %s because it is validated", idx)
                 # Skip matches that are marked as validated
                 continue
-            boxes.append(self.line_editors[idx].GridVBox)
 
-        self.editor_line_matching_vbox_content.children = []
+            if not line.items and not line.unmatched_ground_truth_words:
+                # Nothing to edit; the line editor would hide itself
+                continue
+            visible.append(idx)
+        return visible
+
+    def rebuild_visible_lines(self):
+        """
+        Rebuild the visible lines in the UI.
+        This function is called when the line matching configuration changes.
+        """
+        # Clear the current content
+        logger.debug("Rebuilding visible lines")
+
+        if self._current_ocr_page is None:
+            return
+
+        logger.debug("Line count: %s", len(self._current_ocr_page.lines))
+
+        boxes = []
+        for idx in self.visible_line_indexes():
+            line_editor = self.line_editors[idx]
+            if line_editor is not None:
+                boxes.append(line_editor.GridVBox)
+            else:
+                boxes.append(self.get_line_placeholder(idx))
+
         self.editor_line_matching_vbox_content.children = boxes
 
     def rebuild_content_ui(self):
@@ -235,4 +323,8 @@ class IpynbPageEditor:
             return
 
         self.regenerate_line_editors()
+        if self._current_pgdp_page:
+            # Open the first lines up front; the rest open when clicked
+            for idx in self.visible_line_indexes()[: self.max_realized_line_editors]:
+                self.realize_line_editor(idx)
         self.rebuild_visible_lines()
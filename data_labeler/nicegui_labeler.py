@@ -1,29 +1,61 @@
 import pathlib
-import base64
+from functools import cached_property, partial
+from html import escape
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from itertools import count
+from time import time_ns
 from logging import getLogger
 import cv2
 from shutil import copyfile
 
-from nicegui import ui
+from fastapi import Response
+from nicegui import app, ui
 
-from pd_book_tools.image_processing.cv2_processing.encoding import (
-    encode_bgr_image_as_png,
-)
 from pd_book_tools.ocr.document import Document
 from pd_book_tools.ocr.page import Page
 from pd_book_tools.pgdp.pgdp_results import PGDPExport, PGDPPage
-from pd_book_tools.ocr.cv2_doctr import doctr_ocr_cv2_image, get_default_doctr_predictor
 
+from .doctr_batching import batch_doctr_ocr_cv2_images
+from .image_encoding import (
+    ENCODE_POOL,
+    encode_bgr_image_as_fast_png,
+    encode_bgr_image_as_jpeg,
+)
 from .nicegui_page_editor import NiceGuiPageEditor
 
 # Configure logging
 logger = getLogger(__name__)
 ui_logger = getLogger(__name__ + ".UI")
 
+# The mismatch colors are kept lossless; the other image tabs are JPEG
+LOSSLESS_PAGE_IMAGES = frozenset({"ocr_image_mismatches"})
+PAGE_IMAGE_NAMES = (
+    "page_image",
+    "ocr_image_pgh_bounding_box",
+    "ocr_image_lines_bounding_box",
+    "ocr_image_words_bounding_box",
+    "ocr_image_mismatches",
+)
+
+
+def page_image_media_type(name: str) -> str:
+    return "image/png" if name in LOSSLESS_PAGE_IMAGES else "image/jpeg"
+
 
 class NiceGuiLabeler:
     """NiceGUI version of the OCR data labeler"""
 
+    # OCR pages by page index, least recently used first
+    matched_ocr_pages: OrderedDict[int, dict]
+    max_cached_pages: int = 8
+
+    # The labeler whose page images the /img/ route serves: the newest one
+    _active_labeler: "NiceGuiLabeler | None" = None
+
+    _text_row_template = "<tr><td>%s</td><td>%s</td></tr>"
+
     def __init__(
         self,
         pgdp_export: PGDPExport | None = None,
@@ -36,16 +68,40 @@ class NiceGuiLabeler:
         start_page_idx=0,
         doctr_predictor=None,
         source_pgdp_data_path: pathlib.Path | str | None = None,
+        ocr_batch_size: int = 3,
     ):
         # Initialize attributes
         self._current_page_idx: int = 0
         self._total_pages: int = 0
         self.current_page_name = ""
-        self.matched_ocr_pages = {}
+        self.matched_ocr_pages = OrderedDict()
+        self._matched_ocr_pages_lock = Lock()
+        # Pages edited since they were last saved; saved before being evicted
+        self._unsaved_pages: set[int] = set()
+        # Encoded page images by (page index, image name):
+        # (source array, bytes, version used to bust the browser cache)
+        self._encoded_image_cache: dict[tuple[int, str], tuple] = {}
+        # Seeded from the clock so a restarted labeler never reuses a version
+        self._image_versions = count(time_ns())
         self.monospace_font_name = monospace_font_name
 
+        NiceGuiLabeler._active_labeler = self
+
         # OCR and data processing
         self.doctr_predictor = doctr_predictor
+        # Pages OCR'd per predictor call when prefetching the next pages; at
+        # most max_cached_pages - 1 are prefetched, so they fit with the current one
+        self.ocr_batch_size = ocr_batch_size
+        # The next pages are OCR'd in the background while a page is viewed;
+        # the lock keeps that and run_ocr from using the predictor at once
+        self._ocr_pool = ThreadPoolExecutor(max_workers=1)
+        self._ocr_lock = Lock()
+        # One future per prefetched page, resolved once that page is stored.
+        # Their done callbacks run on the OCR thread, hence the lock
+        self._prefetching: dict[int, Future] = {}
+        self._prefetching_lock = Lock()
+        # Prefetched pages not yet navigated to; these are never evicted
+        self._unvisited_prefetched: set[int] = set()
         self.pgdp_export = pgdp_export
 
         # Project loading
@@ -77,9 +133,6 @@ class NiceGuiLabeler:
             self.page_indexby_nbr = {}
             self._total_pages = 0
 
-        # Initialize OCR predictor
-        self.init_ocr_doctr_predictor()
-
         # UI elements (will be initialized in setup_ui)
         self.current_page_display = None
         self.page_number_input = None
@@ -143,6 +196,7 @@ class NiceGuiLabeler:
         monospace_font_name: str = "monospace",
         monospace_font_path: pathlib.Path | str | None = None,
         doctr_predictor=None,
+        ocr_batch_size: int = 3,
     ):
         """Create a labeler instance that can load projects from the source directory"""
         # Set default paths relative to source directory
@@ -164,6 +218,7 @@ class NiceGuiLabeler:
             monospace_font_path=monospace_font_path,
             doctr_predictor=doctr_predictor,
             source_pgdp_data_path=source_pgdp_data_path,
+            ocr_batch_size=ocr_batch_size,
         )
 
     def create_path(self, str_or_path: pathlib.Path | str) -> pathlib.Path:
@@ -174,12 +229,15 @@ class NiceGuiLabeler:
             str_or_path.mkdir(parents=True, exist_ok=True)
         return str_or_path
 
-    def init_ocr_doctr_predictor(self):
-        """Initialize the OCR predictor"""
+    @cached_property
+    def main_ocr_predictor(self):
+        """The OCR predictor, loaded the first time a page needs fresh OCR."""
         if self.doctr_predictor:
-            self.main_ocr_predictor = self.doctr_predictor
-            return
-        self.main_ocr_predictor = get_default_doctr_predictor()
+            return self.doctr_predictor
+        from pd_book_tools.ocr.cv2_doctr import get_default_doctr_predictor
+
+        logger.debug("Loading default doctr predictor")
+        return get_default_doctr_predictor()
 
     @property
     def current_page_idx(self):
@@ -213,9 +271,12 @@ class NiceGuiLabeler:
 
     @property
     def export_prefix(self):
+        return self._page_export_prefix(self.current_page_idx)
+
+    def _page_export_prefix(self, page_idx: int) -> str:
         if not self.pgdp_export:
-            return f"unknown_project_{self.current_page_idx}"
-        return f"{self.pgdp_export.project_id}_{self.current_page_idx}"
+            return f"unknown_project_{page_idx}"
+        return f"{self.pgdp_export.project_id}_{page_idx}"
 
     def prev_page(self):
         """Go to previous page"""
@@ -244,6 +305,15 @@ class NiceGuiLabeler:
         """Run OCR or get saved OCR document"""
         ui_logger.debug(f"Running OCR for page index: {self.current_page_idx}")
 
+        with self._prefetching_lock:
+            prefetch = self._prefetching.get(self.current_page_idx)
+        if prefetch is not None:
+            # The page is already being OCR'd in the background; if that
+            # failed (it logs the error) the page is OCR'd below instead
+            wait([prefetch])
+        with self._matched_ocr_pages_lock:
+            self._unvisited_prefetched.discard(self.current_page_idx)
+
         # Import saved data if it exists
         self.import_ocr_document()
 
@@ -251,22 +321,27 @@ class NiceGuiLabeler:
         current_idx = int(self.current_page_idx)  # Ensure it's a simple int
         needs_ocr = (current_idx not in self.matched_ocr_pages) or force_refresh_ocr
 
+        # Only this page is OCR'd here; the next ones are batched in the
+        # background by prefetch_ocr_in_background
         if needs_ocr:
             current_page = self.current_pgdp_page
             if not current_page:
                 ui_logger.error("Cannot run OCR: no current page available")
                 return
 
+            from pd_book_tools.ocr.cv2_doctr import doctr_ocr_cv2_image
+
             source_image = current_page.png_full_path
             cv2_numpy_image = cv2.imread(str(source_image.resolve()))
 
             # Run OCR
-            ocr_page: Page = doctr_ocr_cv2_image(
-                image=cv2_numpy_image,
-                source_image=str(source_image),
-                predictor=self.main_ocr_predictor,
-            )
-            ocr_page.cv2_numpy_page_image = cv2.imread(str(source_image.resolve()))
+            with self._ocr_lock:
+                ocr_page: Page = doctr_ocr_cv2_image(
+                    image=cv2_numpy_image,
+                    source_image=str(source_image),
+                    predictor=self.main_ocr_predictor,
+                )
+            ocr_page.cv2_numpy_page_image = cv2_numpy_image
 
             ui_logger.debug(
                 f"OCR Completed. Page text length: {len(ocr_page.text)} characters."
@@ -275,7 +350,159 @@ class NiceGuiLabeler:
             ocr_page.reorganize_page()
             ocr_page.add_ground_truth(current_page.processed_page_text)
 
-            self.matched_ocr_pages[current_idx] = {"page": ocr_page}
+            self._store_ocr_page(current_idx, ocr_page)
+        else:
+            self._touch_ocr_page(current_idx)
+        self._evict_ocr_pages(save_unsaved=True)
+
+    def _ocr_json_path(self, page_idx: int) -> pathlib.Path:
+        return pathlib.Path(
+            self.labeled_ocr_path, f"{self.pgdp_export.project_id}_{page_idx}.json"
+        )
+
+    def _prefetch_ocr(self, page_futures: dict[int, Future]):
+        """OCR pages that aren't loaded or saved yet, `ocr_batch_size` per predictor call.
+
+        Runs on the prefetch thread. Each page's future is resolved once the
+        page is stored, so run_ocr waits for just that page instead of
+        OCRing it again.
+        """
+        page_indices = list(page_futures)
+        for start in range(0, len(page_indices), self.ocr_batch_size):
+            # Cancelled pages (e.g. by a project load) are skipped
+            batch = [
+                idx
+                for idx in page_indices[start : start + self.ocr_batch_size]
+                if page_futures[idx].set_running_or_notify_cancel()
+            ]
+            to_ocr = [
+                idx
+                for idx in batch
+                if idx not in self.matched_ocr_pages
+                # Saved pages are imported when navigated to; nothing to OCR
+                and not self._ocr_json_path(idx).exists()
+            ]
+            try:
+                self._batch_run_ocr(to_ocr, page_futures)
+            except Exception as e:
+                logger.exception(f"Error prefetching OCR for page indices: {to_ocr}")
+                for idx in to_ocr:
+                    if not page_futures[idx].done():
+                        page_futures[idx].set_exception(e)
+            for idx in batch:
+                if not page_futures[idx].done():
+                    page_futures[idx].set_result(None)
+
+    def prefetch_ocr_in_background(self, start_idx: int):
+        """OCR the pages from `start_idx` on a worker thread, ahead of navigation."""
+        window = range(
+            start_idx,
+            min(
+                start_idx + min(self.ocr_batch_size, self.max_cached_pages - 1),
+                self.total_pages + 1,
+            ),
+        )
+        with self._matched_ocr_pages_lock:
+            # Pages prefetched for an earlier position may be evicted again
+            self._unvisited_prefetched.intersection_update(window)
+        with self._prefetching_lock:
+            page_indices = [
+                idx
+                for idx in window
+                if idx not in self.matched_ocr_pages
+                and idx not in self._prefetching
+                and not self._ocr_json_path(idx).exists()
+            ]
+            page_futures = {idx: Future() for idx in page_indices}
+            self._prefetching.update(page_futures)
+        if not page_indices:
+            return
+        logger.debug(f"Prefetching OCR for page indices: {page_indices}")
+        for idx, future in page_futures.items():
+            future.add_done_callback(partial(self._prefetch_done, idx))
+        self._ocr_pool.submit(self._prefetch_ocr, page_futures)
+
+    def _prefetch_done(self, page_idx: int, future: Future):
+        with self._prefetching_lock:
+            if self._prefetching.get(page_idx) is future:
+                del self._prefetching[page_idx]
+
+    def _batch_run_ocr(
+        self, page_indices: list[int], page_futures: dict[int, Future]
+    ):
+        """OCR several prefetched pages with a single predictor call and store them."""
+        if not page_indices:
+            return
+        ui_logger.debug(f"Running batched OCR for page indices: {page_indices}")
+        pgdp_pages = [self.pgdp_export.pages[idx] for idx in page_indices]
+        cv2_numpy_images = [
+            cv2.imread(str(pgdp_page.png_full_path.resolve()))
+            for pgdp_page in pgdp_pages
+        ]
+        with self._ocr_lock:
+            ocr_pages = batch_doctr_ocr_cv2_images(
+                self.main_ocr_predictor,
+                cv2_numpy_images,
+                [pgdp_page.png_full_path for pgdp_page in pgdp_pages],
+            )
+
+        for page_idx, pgdp_page, cv2_numpy_image, ocr_page in zip(
+            page_indices, pgdp_pages, cv2_numpy_images, ocr_pages
+        ):
+            ocr_page.cv2_numpy_page_image = cv2_numpy_image
+
+            ocr_page.reorganize_page()
+            ocr_page.add_ground_truth(pgdp_page.processed_page_text)
+
+            self._store_ocr_page(page_idx, ocr_page, prefetched=True)
+            page_futures[page_idx].set_result(None)
+
+    def _store_ocr_page(self, page_idx: int, ocr_page: Page, prefetched: bool = False):
+        """Cache an OCR page, evicting the least recently used pages over the cap."""
+        with self._matched_ocr_pages_lock:
+            if prefetched:
+                self._unvisited_prefetched.add(page_idx)
+            self.matched_ocr_pages[page_idx] = {"page": ocr_page}
+            self.matched_ocr_pages.move_to_end(page_idx)
+            self._unsaved_pages.discard(page_idx)
+            self._invalidate_page_images(page_idx)
+        self._evict_ocr_pages()
+
+    def _evict_ocr_pages(self, save_unsaved: bool = False):
+        """Drop the least recently used pages over max_cached_pages.
+
+        Unsaved pages are only evicted with `save_unsaved`, which saves them
+        first. Only run_ocr passes it, so pages are never written from the
+        prefetch thread. Prefetched pages are kept until navigated to.
+        """
+        with self._matched_ocr_pages_lock:
+            excess = len(self.matched_ocr_pages) - self.max_cached_pages
+            evictable = [
+                idx
+                for idx in self.matched_ocr_pages
+                if idx != self.current_page_idx
+                and idx not in self._unvisited_prefetched
+                and (save_unsaved or idx not in self._unsaved_pages)
+            ]
+            for idx in evictable[: max(excess, 0)]:
+                if idx in self._unsaved_pages:
+                    # Save the edits; the page is imported again when revisited
+                    self._save_ocr_page(idx)
+                logger.debug(f"Evicting OCR page index {idx} from the page cache")
+                del self.matched_ocr_pages[idx]
+                self._invalidate_page_images(idx)
+
+    def _mark_page_edited(self, page_idx: int):
+        """Flag a page as unsaved and drop its cached OCR text table."""
+        self._unsaved_pages.add(page_idx)
+        page_data = self.matched_ocr_pages.get(page_idx)
+        if page_data is not None:
+            page_data.pop("ocr_text_html", None)
+
+    def _touch_ocr_page(self, page_idx: int):
+        with self._matched_ocr_pages_lock:
+            if page_idx in self.matched_ocr_pages:
+                self.matched_ocr_pages.move_to_end(page_idx)
 
     def reset_ocr(self):
         """Reset OCR for current page"""
@@ -289,42 +516,72 @@ class NiceGuiLabeler:
         )
         ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
         ocr_page.refresh_page_images()
+        self._invalidate_page_images(self.current_page_idx)
         self.reload_page_images_ui()
         self.update_images()
 
+    def _encode_cached(self, idx: int, name: str, img) -> bytes | None:
+        """Encoded bytes of a page image, re-encoded only when the array changes."""
+        if img is None:
+            return None
+        cached = self._encoded_image_cache.get((idx, name))
+        # The entry holds the array, so its identity can't be reused meanwhile
+        if cached is not None and cached[0] is img:
+            return cached[1]
+        if name in LOSSLESS_PAGE_IMAGES:
+            encoded = encode_bgr_image_as_fast_png(img)
+        else:
+            encoded = encode_bgr_image_as_jpeg(img)
+        self._encoded_image_cache[(idx, name)] = (
+            img,
+            encoded,
+            next(self._image_versions),
+        )
+        return encoded
+
+    def _invalidate_page_images(self, idx: int):
+        """Drop the encoded images of a page whose images were redrawn."""
+        # list() snapshots the keys; pages can be stored from the OCR prefetch thread
+        for key in [key for key in list(self._encoded_image_cache) if key[0] == idx]:
+            self._encoded_image_cache.pop(key, None)
+
+    def _serve_image(self, idx: int, name: str) -> Response:
+        """Raw bytes of an encoded page image, for the ui.image sources."""
+        page_data = self.matched_ocr_pages.get(idx)
+        if name not in PAGE_IMAGE_NAMES or not page_data or not page_data.get(name):
+            return Response(status_code=404)
+        return Response(
+            content=page_data[name],
+            media_type=page_image_media_type(name),
+            headers={"Cache-Control": "max-age=31536000, immutable"},
+        )
+
     def reload_page_images_ui(self):
         """Reload page images for UI display"""
         logger.debug(f"Reloading page images for page index: {self.current_page_idx}")
-        ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
+        idx = self.current_page_idx
+        ocr_page: Page = self.matched_ocr_pages[idx]["page"]
 
         if ocr_page.cv2_numpy_page_image is None:
             raise ValueError("Current OCR page does not have a valid image.")
 
-        self.matched_ocr_pages[self.current_page_idx] = {
-            **self.matched_ocr_pages[self.current_page_idx],
+        images = {
+            "page_image": ocr_page.cv2_numpy_page_image,
+            "ocr_image_words_bounding_box": ocr_page.cv2_numpy_page_image_word_with_bboxes,
+            "ocr_image_mismatches": ocr_page.cv2_numpy_page_image_matched_word_with_colors,
+            "ocr_image_lines_bounding_box": ocr_page.cv2_numpy_page_image_line_with_bboxes,
+            "ocr_image_pgh_bounding_box": ocr_page.cv2_numpy_page_image_paragraph_with_bboxes,
+        }
+        futures = {
+            name: ENCODE_POOL.submit(self._encode_cached, idx, name, img)
+            for name, img in images.items()
+        }
+
+        self.matched_ocr_pages[idx] = {
+            **self.matched_ocr_pages[idx],
             "width": ocr_page.cv2_numpy_page_image.shape[1],
             "height": ocr_page.cv2_numpy_page_image.shape[0],
-            "page_image": encode_bgr_image_as_png(ocr_page.cv2_numpy_page_image),
-            "ocr_image_words_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_word_with_bboxes
-            )
-            if ocr_page.cv2_numpy_page_image_word_with_bboxes is not None
-            else None,
-            "ocr_image_mismatches": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_matched_word_with_colors
-            )
-            if ocr_page.cv2_numpy_page_image_matched_word_with_colors is not None
-            else None,
-            "ocr_image_lines_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_line_with_bboxes
-            )
-            if ocr_page.cv2_numpy_page_image_line_with_bboxes is not None
-            else None,
-            "ocr_image_pgh_bounding_box": encode_bgr_image_as_png(
-                ocr_page.cv2_numpy_page_image_paragraph_with_bboxes
-            )
-            if ocr_page.cv2_numpy_page_image_paragraph_with_bboxes is not None
-            else None,
+            **{name: future.result() for name, future in futures.items()},
         }
 
     def expand_and_refine_all_bboxes(self):
@@ -345,12 +602,14 @@ class NiceGuiLabeler:
             )
 
         ocr_page.refine_bounding_boxes(padding_px=2)
+        self._mark_page_edited(self.current_page_idx)
         self.refresh_ui()
 
     def refine_all_bboxes(self):
         """Refine all bounding boxes"""
         ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
         ocr_page.refine_bounding_boxes(padding_px=2)
+        self._mark_page_edited(self.current_page_idx)
         self.refresh_ui()
 
     def export_training(self):
@@ -381,31 +640,35 @@ class NiceGuiLabeler:
             ui.notify("No OCR page to save", type="negative")
             return
 
-        ocr_page: Page = self.matched_ocr_pages[self.current_page_idx]["page"]
-        ocr_image_path = self.current_pgdp_page.png_full_path
+        self._save_ocr_page(self.current_page_idx)
 
-        # Copy image to labeled OCR path
-        target_image_path = pathlib.Path(
-            self.labeled_ocr_path, f"{self.export_prefix}.png"
+        ui.notify(
+            f"Saved OCR document for page {self.current_page_idx}", type="positive"
         )
 
+    def _save_ocr_page(self, page_idx: int):
+        """Write a cached OCR page and its image to the labeled OCR path."""
+        ocr_page: Page = self.matched_ocr_pages[page_idx]["page"]
+        ocr_image_path = self.pgdp_export.pages[page_idx].png_full_path
+        prefix = self._page_export_prefix(page_idx)
+
+        # Copy image to labeled OCR path
+        target_image_path = pathlib.Path(self.labeled_ocr_path, f"{prefix}.png")
+
         ocr_document: Document = Document(
             pages=[ocr_page],
             source_lib="doctr-pgdp-labeled",
             source_path=target_image_path,
         )
 
-        target_path = pathlib.Path(self.labeled_ocr_path, f"{self.export_prefix}.json")
+        target_path = pathlib.Path(self.labeled_ocr_path, f"{prefix}.json")
 
         logger.info(f"Exporting OCR document to {target_path}")
         ocr_document.to_json_file(target_path)
 
         logger.info(f"Copying OCR image to {target_image_path}")
         copyfile(ocr_image_path, target_image_path)
-
-        ui.notify(
-            f"Saved OCR document for page {self.current_page_idx}", type="positive"
-        )
+        self._unsaved_pages.discard(page_idx)
 
     def import_ocr_document(self):
         """Import OCR document from JSON file"""
@@ -430,7 +693,7 @@ class NiceGuiLabeler:
             return
 
         ocr_page.cv2_numpy_page_image = cv2.imread(str(source_image.resolve()))
-        self.matched_ocr_pages[self.current_page_idx] = {"page": ocr_page}
+        self._store_ocr_page(self.current_page_idx, ocr_page)
 
     def reload_ocr_from_file(self):
         """Reload OCR from file"""
@@ -445,70 +708,57 @@ class NiceGuiLabeler:
 
         page_data = self.matched_ocr_pages[self.current_page_idx]
 
-        # Convert binary image data to base64 for display
-        if self.plain_image is not None and page_data.get("page_image") is not None:
-            img_b64 = base64.b64encode(page_data["page_image"]).decode()
-            self.plain_image.set_source(f"data:image/png;base64,{img_b64}")
-
-        if (
-            self.ocr_image_pgh_bounding_box is not None
-            and page_data.get("ocr_image_pgh_bounding_box") is not None
+        idx = self.current_page_idx
+        for image_widget, name in zip(
+            (
+                self.plain_image,
+                self.ocr_image_pgh_bounding_box,
+                self.ocr_image_lines_bounding_box,
+                self.ocr_image_words_bounding_box,
+                self.ocr_image_mismatches,
+            ),
+            PAGE_IMAGE_NAMES,
         ):
-            img_b64 = base64.b64encode(page_data["ocr_image_pgh_bounding_box"]).decode()
-            self.ocr_image_pgh_bounding_box.set_source(
-                f"data:image/png;base64,{img_b64}"
-            )
-
-        if (
-            self.ocr_image_lines_bounding_box is not None
-            and page_data.get("ocr_image_lines_bounding_box") is not None
-        ):
-            img_b64 = base64.b64encode(
-                page_data["ocr_image_lines_bounding_box"]
-            ).decode()
-            self.ocr_image_lines_bounding_box.set_source(
-                f"data:image/png;base64,{img_b64}"
-            )
-
-        if (
-            self.ocr_image_words_bounding_box is not None
-            and page_data.get("ocr_image_words_bounding_box") is not None
-        ):
-            img_b64 = base64.b64encode(
-                page_data["ocr_image_words_bounding_box"]
-            ).decode()
-            self.ocr_image_words_bounding_box.set_source(
-                f"data:image/png;base64,{img_b64}"
-            )
-
-        if (
-            self.ocr_image_mismatches is not None
-            and page_data.get("ocr_image_mismatches") is not None
-        ):
-            img_b64 = base64.b64encode(page_data["ocr_image_mismatches"]).decode()
-            self.ocr_image_mismatches.set_source(f"data:image/png;base64,{img_b64}")
+            if image_widget is None or page_data.get(name) is None:
+                continue
+            # The version changes whenever the image is re-encoded
+            cached = self._encoded_image_cache.get((idx, name))
+            version = cached[2] if cached is not None else 0
+            image_widget.set_source(f"/img/{idx}/{name}?v={version}")
 
     def update_text_displays(self):
         """Update text displays"""
         if self.current_page_idx not in self.matched_ocr_pages:
             return
 
+        # The tables are built once per page and kept until the page is edited
+        page_data = self.matched_ocr_pages[self.current_page_idx]
+
         # Update OCR text display
         if self.ocr_text_display:
-            ocr_lines = self.current_ocr_page.text.splitlines()
-            ocr_html = "<table style='font-family: monospace; font-size: 12px;'>"
-            for i, line in enumerate(ocr_lines):
-                ocr_html += f"<tr><td>{i}</td><td>{line}</td></tr>"
-            ocr_html += "</table>"
-            self.ocr_text_display.content = ocr_html
+            if "ocr_text_html" not in page_data:
+                page_data["ocr_text_html"] = self._text_table_html(
+                    enumerate(page_data["page"].text.splitlines())
+                )
+            self.ocr_text_display.content = page_data["ocr_text_html"]
 
         # Update PGDP text display
         if self.pgdp_text_display:
-            pgdp_html = "<table style='font-family: monospace; font-size: 12px;'>"
-            for line_idx, line in self.current_pgdp_page.processed_lines:
-                pgdp_html += f"<tr><td>{line_idx}</td><td>{line}</td></tr>"
-            pgdp_html += "</table>"
-            self.pgdp_text_display.content = pgdp_html
+            if "pgdp_text_html" not in page_data:
+                page_data["pgdp_text_html"] = self._text_table_html(
+                    self.current_pgdp_page.processed_lines
+                )
+            self.pgdp_text_display.content = page_data["pgdp_text_html"]
+
+    def _text_table_html(self, numbered_lines) -> str:
+        rows = "".join(
+            self._text_row_template % (escape(str(line_idx)), escape(line))
+            for line_idx, line in numbered_lines
+        )
+        return (
+            "<table style='font-family: monospace; font-size: 12px;'>"
+            f"{rows}</table>"
+        )
 
     def refresh_ui(self):
         """Refresh the entire UI"""
@@ -549,6 +799,9 @@ class NiceGuiLabeler:
                 ui.notify(f"Error updating text displays: {e}", type="negative")
                 raise e
 
+            # The next page is usually opened next; OCR it while this one is viewed
+            self.prefetch_ocr_in_background(self.current_page_idx + 1)
+
             # Update page editor with new data
             if self.page_editor:
                 if not hasattr(self, "current_pgdp_page") or not hasattr(
@@ -730,17 +983,25 @@ class NiceGuiLabeler:
 
                         def page_image_change_callback():
                             """Callback when page images need to be refreshed"""
+                            self._mark_page_edited(self.current_page_idx)
                             try:
                                 self.current_ocr_page.refresh_page_images()
+                                self._invalidate_page_images(self.current_page_idx)
+                                self.reload_page_images_ui()
                                 self.update_images()
                             except (KeyError, AttributeError):
                                 pass
 
+                        def page_edited_callback():
+                            """Callback when a line edit leaves the page images as they are"""
+                            self._mark_page_edited(self.current_page_idx)
+
                         self.page_editor = NiceGuiPageEditor(
                             current_pgdp_page=None,  # Will be set in refresh_ui
                             current_ocr_page=None,  # Will be set in refresh_ui
                             monospace_font_name=self.monospace_font_name,
                             page_image_change_callback=page_image_change_callback,
+                            page_edited_callback=page_edited_callback,
                         )
                         self.page_editor.draw_ui(page_editor_container)
 
@@ -803,6 +1064,9 @@ class NiceGuiLabeler:
             return False
 
         try:
+            # Save and drop the pages of the previous project first
+            self._reset_page_caches()
+
             # Load the PGDP export from the JSON file
             self.pgdp_export = PGDPExport.from_json_file(pages_json_path)
 
@@ -827,6 +1091,26 @@ class NiceGuiLabeler:
             )
             return False
 
+    def _reset_page_caches(self):
+        """Finish background OCR, save edited pages and forget every cached page."""
+        # Snapshot under the lock; done callbacks remove entries from the OCR thread
+        with self._prefetching_lock:
+            futures = list(self._prefetching.values())
+        for future in futures:
+            future.cancel()
+        # A batch that already started still stores its pages; let it finish
+        wait(futures)
+        with self._prefetching_lock:
+            self._prefetching.clear()
+
+        with self._matched_ocr_pages_lock:
+            for idx in sorted(self._unsaved_pages & self.matched_ocr_pages.keys()):
+                self._save_ocr_page(idx)
+            self.matched_ocr_pages.clear()
+            self._unsaved_pages.clear()
+            self._unvisited_prefetched.clear()
+            self._encoded_image_cache.clear()
+
     def on_load_project_clicked(self):
         """Handle the Load Project button click"""
         if not self.project_selector or not self.project_selector.value:
@@ -844,6 +1128,18 @@ class NiceGuiLabeler:
         ui.run(host=host, port=port, title="OCR Data Labeler")
 
 
+def _serve_active_labeler_image(idx: int, name: str) -> Response:
+    labeler = NiceGuiLabeler._active_labeler
+    if labeler is None:
+        return Response(status_code=404)
+    return labeler._serve_image(idx, name)
+
+
+# Page images are served as raw bytes instead of base64 data URLs. The route
+# is global to the app, so it is added once and not per labeler.
+app.add_api_route("/img/{idx}/{name}", _serve_active_labeler_image)
+
+
 # Example usage function
 def create_nicegui_labeler(
     pgdp_export: PGDPExport,
@@ -551,6 +551,8 @@ class NiceGuiLineEditor:
             )
         self.refresh_ui()
         ui.notify("Copied OCR text to ground truth", type="positive")
+        if self.line_change_callback:
+            self.line_change_callback()
 
     def delete_line(self):
         """Delete the current line"""
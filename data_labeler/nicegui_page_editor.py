@@ -29,12 +29,15 @@ class NiceGuiPageEditor:
         current_ocr_page: Page | None,
         monospace_font_name: str = "monospace",
         page_image_change_callback: Optional[Callable] = None,
+        page_edited_callback: Optional[Callable] = None,
     ):
         # Core data
         self._current_pgdp_page = current_pgdp_page
         self._current_ocr_page = current_ocr_page
         self.monospace_font_name = monospace_font_name
         self.page_image_change_callback = page_image_change_callback
+        # Called on line edits that don't redraw the page images
+        self.page_edited_callback = page_edited_callback
         
         # Line matching configuration
         self.line_matching_configuration: LineMatching = LineMatching.SHOW_ALL_LINES
@@ -56,6 +59,8 @@ class NiceGuiPageEditor:
         """Create callback for line changes"""
         def line_change_callback():
             logger.debug("Line change callback triggered")
+            if self.page_edited_callback:
+                self.page_edited_callback()
             self.rebuild_visible_lines()
         return line_change_callback
     
@@ -374,6 +379,7 @@ def create_nicegui_page_editor(
     current_ocr_page: Page | None = None,
     monospace_font_name: str = "monospace",
     page_image_change_callback: Optional[Callable] = None,
+    page_edited_callback: Optional[Callable] = None,
 ) -> NiceGuiPageEditor:
     """Create a NiceGUI page editor with common settings"""
     return NiceGuiPageEditor(
@@ -381,4 +387,5 @@ def create_nicegui_page_editor(
         current_ocr_page=current_ocr_page,
         monospace_font_name=monospace_font_name,
         page_image_change_callback=page_image_change_callback,
+        page_edited_callback=page_edited_callback,
     )